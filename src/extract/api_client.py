@@ -3,6 +3,7 @@ API client for disease.sh COVID-19 data extraction.
 """
 
 import requests
+import hashlib
 import time
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
@@ -31,6 +32,10 @@ class CovidAPIClient:
         # Setup session with retry strategy
         self.session = self._setup_session()
         
+        # Digest of the raw body of the most recent response, taken before
+        # JSON decoding so callers can detect unchanged snapshots cheaply
+        self.last_response_digest: Optional[str] = None
+        
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 60 / self.rate_limit  # seconds between requests
@@ -99,6 +104,7 @@ class CovidAPIClient:
             )
             response.raise_for_status()
             
+            self.last_response_digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
             data = response.json()
             self.logger.debug(f"Successfully retrieved data from {endpoint}")
             
@@ -8,6 +8,11 @@ from typing import Dict, List, Any, Optional, Tuple
 import json
 from pathlib import Path
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 from .api_client import CovidAPIClient
 from ..utils.config import config
 from ..utils.logger import get_logger
@@ -22,6 +27,15 @@ class CovidDataExtractor:
         self.api_client = CovidAPIClient()
         self.storage_config = config.get_storage_config()
         
+        # Fingerprint cache used to skip rebuilding unchanged snapshots;
+        # disabled unless storage.cache_dir is configured
+        cache_dir = self.storage_config.get('cache_dir')
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._cache_state = self._load_cache_state()
+        
+        # Output directories already created by this extractor
+        self._ensured_dirs = set()
+        
     def extract_all_data(self, include_historical: bool = True,
                         historical_days: int = 30) -> Dict[str, pd.DataFrame]:
         """
@@ -87,6 +101,12 @@ class CovidDataExtractor:
         try:
             data = self.api_client.get_global_data()
             
+            # Reuse the cached frame if the source has not been updated
+            fingerprint = self.api_client.last_response_digest
+            cached_df = self._get_cached_frame('global', fingerprint)
+            if cached_df is not None:
+                return cached_df
+            
             # Convert to DataFrame
             df = pd.DataFrame([data])
             
@@ -99,6 +119,7 @@ class CovidDataExtractor:
             if 'updated' in df.columns:
                 df['updated'] = pd.to_datetime(df['updated'], unit='ms')
             
+            self._cache_frame('global', fingerprint, df)
             self.logger.info(f"Extracted global data with {len(df)} records")
             return df
             
@@ -116,24 +137,21 @@ class CovidDataExtractor:
         try:
             data = self.api_client.get_countries_data()
             
+            # Reuse the cached frame if the source has not been updated
+            fingerprint = self.api_client.last_response_digest
+            cached_df = self._get_cached_frame('countries', fingerprint)
+            if cached_df is not None:
+                return cached_df
+            
             # Convert to DataFrame
-            df = pd.DataFrame(data)
+            df = self._build_countries_frame(data)
             
             # Add extraction metadata
             df['extraction_date'] = datetime.now()
             df['data_source'] = 'disease.sh'
             df['data_type'] = 'countries'
             
-            # Convert timestamp fields
-            if 'updated' in df.columns:
-                df['updated'] = pd.to_datetime(df['updated'], unit='ms')
-            
-            # Flatten nested country info
-            if 'countryInfo' in df.columns:
-                country_info = pd.json_normalize(df['countryInfo'])
-                country_info.columns = ['country_' + col for col in country_info.columns]
-                df = pd.concat([df.drop('countryInfo', axis=1), country_info], axis=1)
-            
+            self._cache_frame('countries', fingerprint, df)
             self.logger.info(f"Extracted countries data with {len(df)} records")
             return df
             
@@ -151,6 +169,12 @@ class CovidDataExtractor:
         try:
             data = self.api_client.get_continents_data()
             
+            # Reuse the cached frame if the source has not been updated
+            fingerprint = self.api_client.last_response_digest
+            cached_df = self._get_cached_frame('continents', fingerprint)
+            if cached_df is not None:
+                return cached_df
+            
             # Convert to DataFrame
             df = pd.DataFrame(data)
             
@@ -163,6 +187,7 @@ class CovidDataExtractor:
             if 'updated' in df.columns:
                 df['updated'] = pd.to_datetime(df['updated'], unit='ms')
             
+            self._cache_frame('continents', fingerprint, df)
             self.logger.info(f"Extracted continents data with {len(df)} records")
             return df
             
@@ -180,6 +205,12 @@ class CovidDataExtractor:
         try:
             data = self.api_client.get_states_data()
             
+            # Reuse the cached frame if the source has not been updated
+            fingerprint = self.api_client.last_response_digest
+            cached_df = self._get_cached_frame('states', fingerprint)
+            if cached_df is not None:
+                return cached_df
+            
             # Convert to DataFrame
             df = pd.DataFrame(data)
             
@@ -192,6 +223,7 @@ class CovidDataExtractor:
             if 'updated' in df.columns:
                 df['updated'] = pd.to_datetime(df['updated'], unit='ms')
             
+            self._cache_frame('states', fingerprint, df)
             self.logger.info(f"Extracted states data with {len(df)} records")
             return df
             
@@ -209,6 +241,12 @@ class CovidDataExtractor:
         try:
             data = self.api_client.get_vaccine_data()
             
+            # Reuse the cached frame if the source has not been updated
+            fingerprint = self.api_client.last_response_digest
+            cached_df = self._get_cached_frame('vaccines', fingerprint)
+            if cached_df is not None:
+                return cached_df
+            
             # Convert to DataFrame
             df = pd.DataFrame(data)
             
@@ -217,6 +255,7 @@ class CovidDataExtractor:
             df['data_source'] = 'disease.sh'
             df['data_type'] = 'vaccines'
             
+            self._cache_frame('vaccines', fingerprint, df)
             self.logger.info(f"Extracted vaccine data with {len(df)} records")
             return df
             
@@ -238,42 +277,16 @@ class CovidDataExtractor:
             # Get global historical data
             data = self.api_client.get_historical_data(days=days)
             
-            # Convert nested time series data to DataFrame
-            records = []
-            
-            if 'cases' in data:
-                for date_str, value in data['cases'].items():
-                    records.append({
-                        'date': date_str,
-                        'metric': 'cases',
-                        'value': value,
-                        'country': 'Global'
-                    })
-            
-            if 'deaths' in data:
-                for date_str, value in data['deaths'].items():
-                    records.append({
-                        'date': date_str,
-                        'metric': 'deaths',
-                        'value': value,
-                        'country': 'Global'
-                    })
-            
-            if 'recovered' in data:
-                for date_str, value in data['recovered'].items():
-                    records.append({
-                        'date': date_str,
-                        'metric': 'recovered',
-                        'value': value,
-                        'country': 'Global'
-                    })
-            
-            df = pd.DataFrame(records)
+            # Convert nested time series data to columns
+            columns = {'date': [], 'metric': [], 'value': [], 'country': []}
+            
+            for metric in ['cases', 'deaths', 'recovered']:
+                if metric in data:
+                    self._append_timeline(columns, data[metric], metric, 'Global')
+            
+            df = self._build_timeseries_frame(columns)
             
             if not df.empty:
-                # Convert date column
-                df['date'] = pd.to_datetime(df['date'])
-                
                 # Add extraction metadata
                 df['extraction_date'] = datetime.now()
                 df['data_source'] = 'disease.sh'
@@ -299,7 +312,7 @@ class CovidDataExtractor:
             DataFrame with country historical data
         """
         try:
-            all_records = []
+            columns = {'date': [], 'metric': [], 'value': [], 'country': []}
             
             for country in countries:
                 self.logger.info(f"Extracting historical data for {country}")
@@ -316,24 +329,15 @@ class CovidDataExtractor:
                     # Process each metric
                     for metric in ['cases', 'deaths', 'recovered']:
                         if metric in timeline:
-                            for date_str, value in timeline[metric].items():
-                                all_records.append({
-                                    'date': date_str,
-                                    'metric': metric,
-                                    'value': value,
-                                    'country': country
-                                })
+                            self._append_timeline(columns, timeline[metric], metric, country)
                 
                 except Exception as e:
                     self.logger.warning(f"Failed to extract data for {country}: {str(e)}")
                     continue
             
-            df = pd.DataFrame(all_records)
+            df = self._build_timeseries_frame(columns)
             
             if not df.empty:
-                # Convert date column
-                df['date'] = pd.to_datetime(df['date'])
-                
                 # Add extraction metadata
                 df['extraction_date'] = datetime.now()
                 df['data_source'] = 'disease.sh'
@@ -346,6 +350,134 @@ class CovidDataExtractor:
             self.logger.error(f"Error extracting country historical data: {str(e)}")
             raise
     
+    def _build_countries_frame(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Build the countries DataFrame with parsed timestamps and flattened country info.
+        
+        Uses Polars for construction when it is installed and converts to pandas
+        at the boundary.
+        """
+        if pl is not None and data:
+            pf = pl.from_dicts(data, infer_schema_length=None)
+            
+            # Nanosecond precision, matching pd.to_datetime in the pandas path
+            if 'updated' in pf.columns:
+                pf = pf.with_columns(
+                    pl.from_epoch('updated', time_unit='ms').cast(pl.Datetime('ns'))
+                )
+            
+            if 'countryInfo' in pf.columns:
+                info_fields = [field.name for field in pf.schema['countryInfo'].fields]
+                info_columns = ['country_' + name for name in info_fields]
+                pf = pf.with_columns(
+                    pl.col('countryInfo').struct.rename_fields(info_columns)
+                ).unnest('countryInfo')
+                
+                # unnest expands in place; the pandas path appends the fields last
+                pf = pf.select(
+                    [col for col in pf.columns if col not in info_columns] + info_columns
+                )
+            
+            return pf.to_pandas()
+        
+        df = pd.DataFrame(data)
+        
+        # Convert timestamp fields
+        if 'updated' in df.columns:
+            df['updated'] = pd.to_datetime(df['updated'], unit='ms')
+        
+        # Flatten nested country info
+        if 'countryInfo' in df.columns:
+            country_info = pd.json_normalize(df['countryInfo'])
+            country_info.columns = ['country_' + col for col in country_info.columns]
+            df = pd.concat([df.drop('countryInfo', axis=1), country_info], axis=1)
+        
+        return df
+    
+    def _append_timeline(self, columns: Dict[str, list], timeline: Dict[str, Any],
+                         metric: str, country: str) -> None:
+        """Append one metric timeline to column-oriented time series buffers."""
+        count = len(timeline)
+        columns['date'].extend(timeline.keys())
+        columns['value'].extend(timeline.values())
+        columns['metric'].extend([metric] * count)
+        columns['country'].extend([country] * count)
+    
+    def _build_timeseries_frame(self, columns: Dict[str, list]) -> pd.DataFrame:
+        """
+        Build a historical DataFrame from column buffers with a parsed date column.
+        
+        Uses Polars for construction and date parsing when it is installed and
+        converts to pandas at the boundary.
+        """
+        if not columns['date']:
+            return pd.DataFrame()
+        
+        if pl is not None:
+            pf = pl.DataFrame(columns).with_columns(
+                pl.col('date').str.strptime(pl.Datetime('ns'), '%m/%d/%y')
+            )
+            return pf.to_pandas()
+        
+        df = pd.DataFrame(columns)
+        df['date'] = pd.to_datetime(df['date'])
+        return df
+    
+    def _load_cache_state(self) -> Dict[str, str]:
+        """Load the persisted endpoint fingerprints."""
+        if self.cache_dir is None:
+            return {}
+        
+        try:
+            with open(self.cache_dir / 'state.json', 'r') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def _get_cached_frame(self, endpoint: str, fingerprint: str) -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame for an endpoint if its source is unchanged.
+        
+        Args:
+            endpoint: Dataset name used as cache key
+            fingerprint: Digest of the current raw API response
+            
+        Returns:
+            Cached DataFrame, or None on a cache miss or when caching is off
+        """
+        if self.cache_dir is None or fingerprint is None:
+            return None
+        
+        cached_path = self.cache_dir / f"{endpoint}.parquet"
+        if self._cache_state.get(endpoint) != fingerprint or not cached_path.exists():
+            return None
+        
+        try:
+            df = pd.read_parquet(cached_path)
+        except Exception as e:
+            self.logger.warning(f"Could not read cached {endpoint} data: {str(e)}")
+            return None
+        
+        df['extraction_date'] = datetime.now()
+        self.logger.info(f"Source {endpoint} data unchanged, reusing cached frame with {len(df)} records")
+        return df
+    
+    def _cache_frame(self, endpoint: str, fingerprint: str, df: pd.DataFrame) -> None:
+        """Persist a freshly built DataFrame and its fingerprint when caching is on."""
+        if self.cache_dir is None or fingerprint is None:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(self.cache_dir / f"{endpoint}.parquet", index=False)
+            
+            self._cache_state[endpoint] = fingerprint
+            with open(self.cache_dir / 'state.json', 'w') as file:
+                json.dump(self._cache_state, file)
+        except Exception as e:
+            # Caching is best-effort and must never fail an extraction
+            self.logger.warning(f"Could not cache {endpoint} data: {str(e)}")
+    
     def save_raw_data(self, data: Dict[str, pd.DataFrame],
                      output_dir: str = "data/raw") -> Dict[str, str]:
         """
@@ -360,26 +492,27 @@ class CovidDataExtractor:
         """
         try:
             output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
+            if output_path not in self._ensured_dirs:
+                output_path.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(output_path)
             
             saved_files = {}
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
+            # Determine file format
+            file_format = self.storage_config.get('file_format', 'parquet')
+            use_parquet = file_format == 'parquet'
+            suffix = f"_{timestamp}.parquet" if use_parquet else f"_{timestamp}.csv"
+            
             for data_type, df in data.items():
                 if df.empty:
                     self.logger.warning(f"Skipping empty dataset: {data_type}")
                     continue
                 
-                # Determine file format
-                file_format = self.storage_config.get('file_format', 'parquet')
-                
-                if file_format == 'parquet':
-                    filename = f"covid_{data_type}_{timestamp}.parquet"
-                    filepath = output_path / filename
+                filepath = output_path / f"covid_{data_type}{suffix}"
+                if use_parquet:
                     df.to_parquet(filepath, index=False)
                 else:
-                    filename = f"covid_{data_type}_{timestamp}.csv"
-                    filepath = output_path / filename
                     df.to_csv(filepath, index=False)
                 
                 saved_files[data_type] = str(filepath)
@@ -4,34 +4,321 @@ Supports AWS S3 and Google Cloud Storage.
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError
+from google.api_core import exceptions as gcp_exceptions
 from google.cloud import storage as gcs
+from google.cloud.storage import transfer_manager
+import s3fs
+import asyncio
+import functools
+import gzip
+import inspect
 import io
+import mmap
+import queue
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple, Union
 from pathlib import Path
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from aiobotocore.session import get_session as get_aio_session
+except ImportError:
+    get_aio_session = None
+
 from ..utils.config import config
 from ..utils.logger import get_logger
 
+# Multipart defaults for S3 uploads: parts above 8MB are sent concurrently
+_S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+_S3_MAX_CONCURRENCY = 10
+_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_S3_MULTIPART_CHUNKSIZE,
+    multipart_chunksize=_S3_MULTIPART_CHUNKSIZE,
+    max_concurrency=_S3_MAX_CONCURRENCY,
+    use_threads=True
+)
+
+# Local files above this size are memory-mapped for S3 uploads
+_MMAP_THRESHOLD = 256 * 1024 * 1024
+
+# GCS objects above this size are uploaded as concurrent chunks
+_GCS_PARALLEL_THRESHOLD = 100 * 1024 * 1024
+_GCS_CHUNK_SIZE = 64 * 1024 * 1024
+_GCS_MAX_WORKERS = 8
+
+# Deletes per request: S3 DeleteObjects takes 1000 keys, a GCS batch 100 calls
+_S3_DELETE_BATCH_SIZE = 1000
+_GCS_DELETE_BATCH_SIZE = 100
+
+# Maximum objects returned per listing page by both S3 and GCS
+_LIST_PAGE_SIZE = 1000
+
+# Rows serialized per orjson call, bounding the transient records list
+_JSON_CHUNK_ROWS = 50000
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values that orjson does not handle natively."""
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if value is pd.NaT or value is pd.NA:
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class _BufferSlice(io.RawIOBase):
+    """
+    Read-only, seekable file object over a memoryview slice.
+    
+    botocore rejects bare memoryviews as request bodies, but accepts any
+    object with read(). This lets multipart parts stream straight out of
+    the serialization buffer without copying each part into new bytes.
+    """
+    
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def readinto(self, b) -> int:
+        count = min(len(b), len(self._view) - self._pos)
+        b[:count] = self._view[self._pos:self._pos + count]
+        self._pos += count
+        return count
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+    
+    def tell(self) -> int:
+        return self._pos
+
+
+def _write_json_records(df: pd.DataFrame, buffer: io.BytesIO) -> None:
+    """Write DataFrame as a gzip-compressed JSON array of records using orjson."""
+    with gzip.GzipFile(fileobj=buffer, mode='wb') as gz:
+        gz.write(b'[')
+        
+        # Serialize in chunks so only one slice of records is alive at a time
+        for start in range(0, len(df), _JSON_CHUNK_ROWS):
+            records = df.iloc[start:start + _JSON_CHUNK_ROWS].to_dict('records')
+            if start:
+                gz.write(b',')
+            payload = orjson.dumps(records, default=_json_default,
+                                   option=orjson.OPT_SERIALIZE_NUMPY)
+            gz.write(payload[1:-1])
+        
+        gz.write(b']')
+
+
+@functools.lru_cache(maxsize=32)
+def _make_writer(fmt: str, schema_key: Tuple) -> Tuple[Callable[[pd.DataFrame, Any], None], str]:
+    """
+    Build a serializer specialized for one file format and DataFrame schema.
+    
+    Pipelines upload the same schemas repeatedly, so the format dispatch and,
+    for frames without object columns, the Arrow schema are built once per
+    (format, dtypes) pair.
+    
+    Args:
+        fmt: Lower-cased file format ('parquet', 'csv', 'json')
+        schema_key: Tuple of (column, dtype) pairs identifying the schema
+        
+    Returns:
+        Tuple of (writer(df, sink), content type)
+    """
+    if fmt == 'parquet':
+        # The Arrow schema is derived once, from dtypes alone, and only when
+        # no column is object dtype; object columns are inferred per frame
+        # from their contents, since the dtype does not fix their Arrow type
+        schema = None
+        if all(dtype != object for _, dtype in schema_key):
+            try:
+                empty = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in schema_key})
+                schema = pa.Schema.from_pandas(empty, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                schema = None
+        
+        def write_parquet(df: pd.DataFrame, sink) -> None:
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False,
+                                         nthreads=os.cpu_count())
+            
+            pq.write_table(
+                table, sink,
+                compression='zstd',
+                compression_level=3,
+                use_dictionary=True,
+                data_page_size=1 << 20
+            )
+        
+        return write_parquet, 'application/octet-stream'
+    
+    if fmt == 'csv':
+        def write_csv(df: pd.DataFrame, sink) -> None:
+            df.to_csv(sink, index=False, compression='gzip')
+        
+        return write_csv, 'text/csv'
+    
+    if fmt == 'json':
+        if orjson is not None:
+            return _write_json_records, 'application/json'
+        
+        def write_json(df: pd.DataFrame, sink) -> None:
+            df.to_json(sink, orient='records', date_format='iso', compression='gzip')
+        
+        return write_json, 'application/json'
+    
+    raise ValueError(f"Unsupported file format: {fmt}")
+
+
+def _is_bucket_error(error: Exception) -> bool:
+    """Check whether an upload error points at a missing or inaccessible bucket."""
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code')
+        return code in ('NoSuchBucket', 'AccessDenied', '403', '404')
+    
+    # s3fs surfaces bucket problems as builtin OS errors
+    return isinstance(error, (gcp_exceptions.NotFound, gcp_exceptions.Forbidden,
+                              FileNotFoundError, PermissionError))
+
+
+def _log_and_raise(msg_tpl: str):
+    """
+    Decorate a loader method to log failures and re-raise them.
+    
+    The message template is formatted with the call's arguments by name
+    plus the exception as 'err', e.g. "Failed to upload DataFrame to {key}: {err}".
+    Arguments are only bound on the failure path.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        def log_error(self, args, kwargs, error):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            self.logger.error(msg_tpl.format(err=error, **bound.arguments))
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                try:
+                    return await func(self, *args, **kwargs)
+                except Exception as e:
+                    log_error(self, args, kwargs, e)
+                    raise
+            
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                log_error(self, args, kwargs, e)
+                raise
+        
+        return wrapper
+    
+    return decorator
+
+
+@functools.lru_cache(maxsize=8)
+def _get_s3_client(region: Optional[str], access_key_id: Optional[str],
+                   secret_access_key: Optional[str]):
+    """
+    Get a shared S3 client for a given region and credentials.
+    
+    boto3 clients are thread-safe, so one client per configuration is reused
+    across loader instances and upload threads. The connection pool is sized
+    to feed concurrent uploads.
+    """
+    session = boto3.session.Session(
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name=region
+    )
+    return session.client(
+        's3',
+        config=BotoConfig(max_pool_connections=32, tcp_keepalive=True)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_gcs_client(project: Optional[str], credentials_path: Optional[str]) -> gcs.Client:
+    """Get a shared GCS client for a given project and credentials file."""
+    if credentials_path:
+        # Without an explicit project, the key file's project_id is used
+        kwargs = {'project': project} if project else {}
+        return gcs.Client.from_service_account_json(credentials_path, **kwargs)
+    return gcs.Client(project=project)
+
 
 class CloudStorageLoader:
     """Loader for uploading data to cloud storage (AWS S3 or Google Cloud Storage)."""
     
-    def __init__(self, provider: Optional[str] = None):
+    # Standard metadata attached to every uploaded object
+    _BASE_META = {'source': 'covid-etl-pipeline'}
+    
+    # Upper bound on idle serialization buffers kept for reuse
+    _BUFFER_POOL_SIZE = 8
+    
+    def __init__(self, provider: Optional[str] = None,
+                 multipart_chunksize: Optional[int] = None,
+                 max_concurrency: Optional[int] = None,
+                 verify_on_init: bool = False):
         """
         Initialize cloud storage loader.
         
         Args:
             provider: Cloud provider ('aws' or 'gcp'). If None, uses config.
+            multipart_chunksize: S3 multipart part size in bytes (default 8MB)
+            max_concurrency: Concurrent S3 part uploads per file (default 10)
+            verify_on_init: Check bucket access during construction. Otherwise
+                the bucket is only checked when an upload hits a bucket error.
         """
         self.logger = get_logger(__name__)
         self.storage_config = config.get_storage_config()
+        self._s3fs = None
+        self._buffer_pool = queue.LifoQueue(maxsize=self._BUFFER_POOL_SIZE)
         
         self.provider = provider or self.storage_config.get('provider', 'aws')
         self.bucket_name = self.storage_config.get('bucket')
         
+        # Reuse the shared transfer config unless the caller tunes it
+        if multipart_chunksize is None and max_concurrency is None:
+            self.s3_transfer_config = _S3_TRANSFER_CONFIG
+        else:
+            chunksize = multipart_chunksize or _S3_MULTIPART_CHUNKSIZE
+            self.s3_transfer_config = TransferConfig(
+                multipart_threshold=chunksize,
+                multipart_chunksize=chunksize,
+                max_concurrency=max_concurrency or _S3_MAX_CONCURRENCY,
+                use_threads=True
+            )
+        
         if not self.bucket_name:
             raise ValueError("Bucket name must be specified in configuration")
         
@@ -43,6 +330,9 @@ class CloudStorageLoader:
         else:
             raise ValueError(f"Unsupported cloud provider: {self.provider}")
         
+        if verify_on_init:
+            self._verify_bucket()
+        
         self.logger.info(f"Initialized {self.provider.upper()} storage loader for bucket: {self.bucket_name}")
     
     def _init_aws_client(self) -> None:
@@ -50,22 +340,17 @@ class CloudStorageLoader:
         try:
             aws_config = config.get_aws_config()
             
-            # Initialize S3 client
-            session_kwargs = {}
+            # Use explicit credentials only when both parts are configured
+            access_key_id = None
+            secret_access_key = None
             if aws_config.get('access_key_id') and aws_config.get('secret_access_key'):
-                session_kwargs.update({
-                    'aws_access_key_id': aws_config['access_key_id'],
-                    'aws_secret_access_key': aws_config['secret_access_key']
-                })
+                access_key_id = aws_config['access_key_id']
+                secret_access_key = aws_config['secret_access_key']
             
-            if aws_config.get('region'):
-                session_kwargs['region_name'] = aws_config['region']
-            
-            self.s3_client = boto3.client('s3', **session_kwargs)
-            
-            # Test connection
-            self.s3_client.head_bucket(Bucket=self.bucket_name)
-            self.logger.info("Successfully connected to AWS S3")
+            self.s3_client = _get_s3_client(
+                aws_config.get('region') or None, access_key_id, secret_access_key
+            )
+            self.logger.info("Initialized AWS S3 client")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize AWS S3 client: {str(e)}")
@@ -76,26 +361,62 @@ class CloudStorageLoader:
         try:
             gcp_config = config.get_gcp_config()
             
-            # Initialize GCS client
-            client_kwargs = {}
-            if gcp_config.get('project_id'):
-                client_kwargs['project'] = gcp_config['project_id']
-            
-            # Set credentials if specified
-            if gcp_config.get('credentials_path'):
-                os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = gcp_config['credentials_path']
-            
-            self.gcs_client = gcs.Client(**client_kwargs)
+            self.gcs_client = _get_gcs_client(
+                gcp_config.get('project_id') or None,
+                gcp_config.get('credentials_path') or None
+            )
             self.gcs_bucket = self.gcs_client.bucket(self.bucket_name)
-            
-            # Test connection
-            self.gcs_bucket.reload()
-            self.logger.info("Successfully connected to Google Cloud Storage")
+            self.logger.info("Initialized Google Cloud Storage client")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize GCP client: {str(e)}")
             raise
     
+    @classmethod
+    def _build_metadata(cls, metadata: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """
+        Build object metadata as a new dict, leaving the caller's dict untouched.
+        
+        Batch uploads pass a shared 'uploaded_at'; it is only computed here
+        when missing.
+        """
+        object_metadata = {**cls._BASE_META, **(metadata or {})}
+        if 'uploaded_at' not in object_metadata:
+            object_metadata['uploaded_at'] = datetime.now().isoformat()
+        return object_metadata
+    
+    def _verify_bucket(self) -> None:
+        """Check that the configured bucket exists and is accessible."""
+        try:
+            if self.provider == 'aws':
+                self.s3_client.head_bucket(Bucket=self.bucket_name)
+            elif self.provider == 'gcp':
+                self.gcs_bucket.reload()
+            
+            self.logger.info(f"Verified access to bucket: {self.bucket_name}")
+            
+        except Exception as e:
+            self.logger.error(f"Bucket {self.bucket_name} is not accessible: {str(e)}")
+            raise
+    
+    def _retry_on_bucket_error(self, upload, *args) -> str:
+        """
+        Run an upload, verifying the bucket and retrying once on bucket errors.
+        
+        A missing or inaccessible bucket fails in _verify_bucket with a clear
+        error. A transient bucket error gets one more upload attempt.
+        """
+        try:
+            return upload(*args)
+        except Exception as e:
+            if not _is_bucket_error(e):
+                raise
+            
+            self.logger.warning(f"Upload hit a bucket error, verifying bucket: {str(e)}")
+            self._verify_bucket()
+            return upload(*args)
+    
+    @_log_and_raise("Failed to upload DataFrame to {key}: {err}")
     def upload_dataframe(self, df: pd.DataFrame, key: str, 
                         file_format: str = 'parquet',
                         metadata: Optional[Dict[str, str]] = None) -> str:
@@ -111,92 +432,337 @@ class CloudStorageLoader:
         Returns:
             Storage URL/path of uploaded file
         """
+        self.logger.info(f"Uploading DataFrame to {key} in {file_format} format")
+        return self._retry_on_bucket_error(
+            self._upload_dataframe, df, key, file_format, metadata
+        )
+    
+    def _upload_dataframe(self, df: pd.DataFrame, key: str, file_format: str,
+                          metadata: Optional[Dict[str, str]]) -> str:
+        """Serialize and upload DataFrame in a single attempt."""
+        fmt = file_format.lower()
+        writer, content_type = _make_writer(fmt, tuple(df.dtypes.items()))
+        
+        # Parquet is written straight into the destination object
+        if fmt == 'parquet':
+            return self._stream_parquet(df, key, metadata, writer, content_type)
+        
+        # Text formats are gzip-compressed to cut bytes on the wire
+        if not key.endswith('.gz'):
+            key = f"{key}.gz"
+        
+        buffer = self._acquire_buffer()
         try:
-            self.logger.info(f"Uploading DataFrame to {key} in {file_format} format")
-            
-            # Convert DataFrame to bytes
-            buffer = io.BytesIO()
-            
-            if file_format.lower() == 'parquet':
-                df.to_parquet(buffer, index=False)
-                content_type = 'application/octet-stream'
-            elif file_format.lower() == 'csv':
-                df.to_csv(buffer, index=False)
-                content_type = 'text/csv'
-            elif file_format.lower() == 'json':
-                df.to_json(buffer, orient='records', date_format='iso')
-                content_type = 'application/json'
-            else:
-                raise ValueError(f"Unsupported file format: {file_format}")
-            
+            writer(df, buffer)
             buffer.seek(0)
             
             # Upload based on provider
             if self.provider == 'aws':
-                return self._upload_to_s3(buffer, key, content_type, metadata)
+                return self._upload_to_s3(buffer, key, content_type, metadata, 'gzip')
             elif self.provider == 'gcp':
-                return self._upload_to_gcs(buffer, key, content_type, metadata)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to upload DataFrame to {key}: {str(e)}")
-            raise
+                return self._upload_to_gcs(buffer, key, content_type, metadata, 'gzip')
+        finally:
+            self._release_buffer(buffer)
     
-    def _upload_to_s3(self, buffer: io.BytesIO, key: str, 
-                     content_type: str, metadata: Optional[Dict[str, str]]) -> str:
-        """Upload buffer to AWS S3."""
+    @_log_and_raise("Failed to upload DataFrame to {key}: {err}")
+    async def aupload_dataframe(self, df: pd.DataFrame, key: str,
+                                file_format: str = 'parquet',
+                                metadata: Optional[Dict[str, str]] = None,
+                                s3_client: Any = None) -> str:
+        """
+        Upload DataFrame to cloud storage from an asyncio event loop.
+        
+        S3 uploads go through aiobotocore, so many files and multipart parts
+        can be in flight on a single thread. For GCS, or when aiobotocore is
+        not installed, the synchronous upload runs in a worker thread.
+        
+        Args:
+            df: DataFrame to upload
+            key: Storage key/path
+            file_format: File format ('parquet', 'csv', 'json')
+            metadata: Optional metadata to attach
+            s3_client: Optional open aiobotocore S3 client to share across uploads
+            
+        Returns:
+            Storage URL/path of uploaded file
+        """
+        self.logger.info(f"Uploading DataFrame to {key} in {file_format} format")
+        
+        if self.provider != 'aws' or get_aio_session is None:
+            return await asyncio.to_thread(
+                self._retry_on_bucket_error, self._upload_dataframe, df, key, file_format, metadata
+            )
+        
+        fmt = file_format.lower()
+        writer, content_type = _make_writer(fmt, tuple(df.dtypes.items()))
+        
+        extra_args = {
+            'ContentType': content_type,
+            'Metadata': self._build_metadata(metadata)
+        }
+        if fmt != 'parquet':
+            if not key.endswith('.gz'):
+                key = f"{key}.gz"
+            extra_args['ContentEncoding'] = 'gzip'
+        
+        buffer = self._acquire_buffer()
         try:
-            extra_args = {
-                'ContentType': content_type,
-                'Metadata': metadata or {}
-            }
+            # Serialization is CPU-bound, so keep it off the event loop
+            await asyncio.to_thread(writer, df, buffer)
             
-            # Add standard metadata
-            extra_args['Metadata'].update({
-                'uploaded_at': datetime.now().isoformat(),
-                'source': 'covid-etl-pipeline'
+            if s3_client is None:
+                async with self._create_aio_s3_client() as s3_client:
+                    await self._aupload_buffer_to_s3(s3_client, buffer, key, extra_args)
+            else:
+                await self._aupload_buffer_to_s3(s3_client, buffer, key, extra_args)
+        finally:
+            self._release_buffer(buffer)
+        
+        s3_url = f"s3://{self.bucket_name}/{key}"
+        self.logger.info(f"Successfully uploaded to S3: {s3_url}")
+        return s3_url
+    
+    def _create_aio_s3_client(self):
+        """Create an aiobotocore S3 client context manager from the AWS config."""
+        aws_config = config.get_aws_config()
+        
+        client_kwargs = {'region_name': aws_config.get('region') or None}
+        if aws_config.get('access_key_id') and aws_config.get('secret_access_key'):
+            client_kwargs.update({
+                'aws_access_key_id': aws_config['access_key_id'],
+                'aws_secret_access_key': aws_config['secret_access_key']
             })
+        
+        return get_aio_session().create_client('s3', **client_kwargs)
+    
+    async def _aupload_buffer_to_s3(self, s3_client: Any, buffer: io.BytesIO, key: str,
+                                    extra_args: Dict[str, Any]) -> None:
+        """
+        Upload an in-memory buffer to S3 with an aiobotocore client.
+        
+        Buffers above the multipart threshold are sent as concurrent parts,
+        with a semaphore bounding the parts in flight.
+        """
+        chunk_size = self.s3_transfer_config.multipart_chunksize
+        view = buffer.getbuffer()
+        
+        try:
+            if view.nbytes <= self.s3_transfer_config.multipart_threshold:
+                await s3_client.put_object(
+                    Bucket=self.bucket_name, Key=key, Body=_BufferSlice(view),
+                    ContentLength=view.nbytes, **extra_args
+                )
+                return
             
-            self.s3_client.upload_fileobj(
-                buffer, 
-                self.bucket_name, 
-                key,
-                ExtraArgs=extra_args
-            )
+            upload_id = (await s3_client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=key, **extra_args
+            ))['UploadId']
+            semaphore = asyncio.Semaphore(self.s3_transfer_config.max_concurrency)
             
-            s3_url = f"s3://{self.bucket_name}/{key}"
-            self.logger.info(f"Successfully uploaded to S3: {s3_url}")
-            return s3_url
+            async def upload_part(part_number: int, start: int) -> Dict[str, Any]:
+                async with semaphore:
+                    with view[start:start + chunk_size] as part:
+                        response = await s3_client.upload_part(
+                            Bucket=self.bucket_name, Key=key, UploadId=upload_id,
+                            PartNumber=part_number, Body=_BufferSlice(part),
+                            ContentLength=part.nbytes
+                        )
+                return {'PartNumber': part_number, 'ETag': response['ETag']}
             
-        except Exception as e:
-            self.logger.error(f"S3 upload failed: {str(e)}")
-            raise
+            tasks = [
+                asyncio.ensure_future(upload_part(part_number, start))
+                for part_number, start in enumerate(range(0, view.nbytes, chunk_size), 1)
+            ]
+            try:
+                parts = await asyncio.gather(*tasks)
+                await s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id,
+                    MultipartUpload={'Parts': parts}
+                )
+                
+            except Exception:
+                # Stop the remaining parts before aborting the upload
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await s3_client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id
+                )
+                raise
+        finally:
+            view.release()
     
-    def _upload_to_gcs(self, buffer: io.BytesIO, key: str,
-                      content_type: str, metadata: Optional[Dict[str, str]]) -> str:
-        """Upload buffer to Google Cloud Storage."""
+    def _acquire_buffer(self) -> io.BytesIO:
+        """Take an idle serialization buffer from the pool, or create one."""
+        try:
+            return self._buffer_pool.get_nowait()
+        except queue.Empty:
+            return io.BytesIO()
+    
+    def _release_buffer(self, buffer: io.BytesIO) -> None:
+        """Reset a serialization buffer and return it to the pool if there is room."""
+        buffer.seek(0)
+        buffer.truncate(0)
         try:
+            self._buffer_pool.put_nowait(buffer)
+        except queue.Full:
+            pass
+    
+    def _stream_parquet(self, df: pd.DataFrame, key: str,
+                        metadata: Optional[Dict[str, str]],
+                        writer: Callable[[pd.DataFrame, Any], None],
+                        content_type: str) -> str:
+        """Write DataFrame as parquet directly into a cloud object without a staging buffer."""
+        object_metadata = self._build_metadata(metadata)
+        
+        if self.provider == 'aws':
+            s3_path = f"{self.bucket_name}/{key}"
+            with self._get_s3fs().open(
+                s3_path, 'wb',
+                block_size=self.s3_transfer_config.multipart_chunksize,
+                s3_additional_kwargs={'ContentType': content_type, 'Metadata': object_metadata}
+            ) as sink:
+                writer(df, sink)
+            
+            storage_url = f"s3://{s3_path}"
+        elif self.provider == 'gcp':
             blob = self.gcs_bucket.blob(key)
+            blob.metadata = object_metadata
             
-            # Set metadata
-            if metadata:
-                blob.metadata = metadata
+            with blob.open('wb', content_type=content_type, ignore_flush=True) as sink:
+                writer(df, sink)
             
-            blob.metadata = blob.metadata or {}
-            blob.metadata.update({
-                'uploaded_at': datetime.now().isoformat(),
-                'source': 'covid-etl-pipeline'
-            })
+            storage_url = f"gs://{self.bucket_name}/{key}"
+        
+        self.logger.info(f"Successfully streamed parquet to {storage_url}")
+        return storage_url
+    
+    def _get_s3fs(self) -> s3fs.S3FileSystem:
+        """Get S3 filesystem used for streaming writes, created on first use."""
+        if self._s3fs is None:
+            aws_config = config.get_aws_config()
             
-            blob.upload_from_file(buffer, content_type=content_type)
+            fs_kwargs = {}
+            if aws_config.get('access_key_id') and aws_config.get('secret_access_key'):
+                fs_kwargs.update({
+                    'key': aws_config['access_key_id'],
+                    'secret': aws_config['secret_access_key']
+                })
             
-            gcs_url = f"gs://{self.bucket_name}/{key}"
-            self.logger.info(f"Successfully uploaded to GCS: {gcs_url}")
-            return gcs_url
+            if aws_config.get('region'):
+                fs_kwargs['client_kwargs'] = {'region_name': aws_config['region']}
             
-        except Exception as e:
-            self.logger.error(f"GCS upload failed: {str(e)}")
-            raise
+            self._s3fs = s3fs.S3FileSystem(**fs_kwargs)
+        
+        return self._s3fs
+    
+    def _upload_to_s3(self, buffer: io.BytesIO, key: str, 
+                     content_type: str, metadata: Optional[Dict[str, str]],
+                     content_encoding: Optional[str] = None) -> str:
+        """Upload buffer to AWS S3."""
+        extra_args = {
+            'ContentType': content_type,
+            'Metadata': self._build_metadata(metadata)
+        }
+        if content_encoding:
+            extra_args['ContentEncoding'] = content_encoding
+        
+        if buffer.getbuffer().nbytes > self.s3_transfer_config.multipart_threshold:
+            self._multipart_upload_to_s3(buffer, key, extra_args)
+        else:
+            self.s3_client.upload_fileobj(
+                buffer, 
+                self.bucket_name, 
+                key,
+                ExtraArgs=extra_args,
+                Config=self.s3_transfer_config
+            )
+        
+        s3_url = f"s3://{self.bucket_name}/{key}"
+        self.logger.info(f"Successfully uploaded to S3: {s3_url}")
+        return s3_url
+    
+    def _multipart_upload_to_s3(self, buffer: io.BytesIO, key: str,
+                                extra_args: Dict[str, Any]) -> None:
+        """
+        Upload an in-memory buffer to S3 as a multipart upload.
+        
+        Every part is submitted at once to a bounded pool and completed parts
+        are collected in any order, so one slow part does not hold back the
+        parts queued behind it. Parts are only sorted for the final
+        complete_multipart_upload call.
+        """
+        chunk_size = self.s3_transfer_config.multipart_chunksize
+        view = buffer.getbuffer()
+        
+        try:
+            upload_id = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=key, **extra_args
+            )['UploadId']
+            
+            try:
+                with ThreadPoolExecutor(max_workers=self.s3_transfer_config.max_concurrency) as executor:
+                    futures = {
+                        executor.submit(self._upload_s3_part, key, upload_id, part_number,
+                                        view, start, start + chunk_size): part_number
+                        for part_number, start in enumerate(range(0, view.nbytes, chunk_size), 1)
+                    }
+                    
+                    parts = []
+                    for future in as_completed(futures):
+                        parts.append({'PartNumber': futures[future], 'ETag': future.result()})
+                
+                parts.sort(key=lambda part: part['PartNumber'])
+                self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id,
+                    MultipartUpload={'Parts': parts}
+                )
+                
+            except Exception:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id
+                )
+                raise
+        finally:
+            view.release()
+    
+    def _upload_s3_part(self, key: str, upload_id: str, part_number: int,
+                        view: memoryview, start: int, end: int) -> str:
+        """Upload one multipart part from a buffer slice and return its ETag."""
+        with view[start:end] as part:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id,
+                PartNumber=part_number, Body=_BufferSlice(part),
+                ContentLength=part.nbytes
+            )
+        return response['ETag']
     
+    def _upload_to_gcs(self, buffer: io.BytesIO, key: str,
+                      content_type: str, metadata: Optional[Dict[str, str]],
+                      content_encoding: Optional[str] = None) -> str:
+        """Upload buffer to Google Cloud Storage."""
+        blob = self.gcs_bucket.blob(key)
+        blob.content_encoding = content_encoding
+        
+        blob.metadata = self._build_metadata(metadata)
+        
+        if buffer.getbuffer().nbytes > _GCS_PARALLEL_THRESHOLD:
+            # Chunked uploads read from disk, so spill the buffer first
+            tmp = tempfile.NamedTemporaryFile(delete=False)
+            try:
+                with tmp:
+                    shutil.copyfileobj(buffer, tmp)
+                self._upload_gcs_chunks_concurrently(blob, tmp.name, content_type)
+            finally:
+                os.unlink(tmp.name)
+        else:
+            blob.upload_from_file(buffer, content_type=content_type)
+        
+        gcs_url = f"gs://{self.bucket_name}/{key}"
+        self.logger.info(f"Successfully uploaded to GCS: {gcs_url}")
+        return gcs_url
+    
+    @_log_and_raise("Failed to upload file {file_path}: {err}")
     def upload_file(self, file_path: str, key: Optional[str] = None,
                    metadata: Optional[Dict[str, str]] = None) -> str:
         """
@@ -210,78 +776,103 @@ class CloudStorageLoader:
         Returns:
             Storage URL/path of uploaded file
         """
-        try:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
-            
-            if key is None:
-                key = file_path.name
-            
-            self.logger.info(f"Uploading file {file_path} to {key}")
-            
-            # Determine content type
-            content_type = self._get_content_type(file_path.suffix)
-            
-            with open(file_path, 'rb') as f:
-                if self.provider == 'aws':
-                    return self._upload_file_to_s3(f, key, content_type, metadata)
-                elif self.provider == 'gcp':
-                    return self._upload_file_to_gcs(f, key, content_type, metadata)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to upload file {file_path}: {str(e)}")
-            raise
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        if key is None:
+            key = file_path.name
+        
+        self.logger.info(f"Uploading file {file_path} to {key}")
+        
+        return self._retry_on_bucket_error(self._upload_local_file, file_path, key, metadata)
     
-    def _upload_file_to_s3(self, file_obj, key: str, content_type: str,
-                          metadata: Optional[Dict[str, str]]) -> str:
-        """Upload file object to S3."""
+    def _upload_local_file(self, file_path: Path, key: str,
+                           metadata: Optional[Dict[str, str]]) -> str:
+        """Upload local file in a single attempt."""
+        # Determine content type and encoding
+        content_type, content_encoding = self._get_content_type(file_path.name)
+        
+        # Hand the path to the client so it reads the file itself
+        if self.provider == 'aws':
+            return self._upload_file_to_s3(file_path, key, content_type, metadata, content_encoding)
+        elif self.provider == 'gcp':
+            return self._upload_file_to_gcs(file_path, key, content_type, metadata, content_encoding)
+    
+    def _upload_file_to_s3(self, file_path: Path, key: str, content_type: str,
+                          metadata: Optional[Dict[str, str]],
+                          content_encoding: Optional[str] = None) -> str:
+        """Upload local file to S3."""
         extra_args = {
             'ContentType': content_type,
-            'Metadata': metadata or {}
+            'Metadata': self._build_metadata(metadata)
         }
+        if content_encoding:
+            extra_args['ContentEncoding'] = content_encoding
         
-        extra_args['Metadata'].update({
-            'uploaded_at': datetime.now().isoformat(),
-            'source': 'covid-etl-pipeline'
-        })
-        
-        self.s3_client.upload_fileobj(file_obj, self.bucket_name, key, ExtraArgs=extra_args)
+        if file_path.stat().st_size > _MMAP_THRESHOLD:
+            # Part uploads slice the mapping instead of copying reads into Python buffers
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.s3_client.upload_fileobj(mapped, self.bucket_name, key,
+                                              ExtraArgs=extra_args, Config=self.s3_transfer_config)
+        else:
+            self.s3_client.upload_file(str(file_path), self.bucket_name, key,
+                                       ExtraArgs=extra_args, Config=self.s3_transfer_config)
         return f"s3://{self.bucket_name}/{key}"
     
-    def _upload_file_to_gcs(self, file_obj, key: str, content_type: str,
-                           metadata: Optional[Dict[str, str]]) -> str:
-        """Upload file object to GCS."""
+    def _upload_file_to_gcs(self, file_path: Path, key: str, content_type: str,
+                           metadata: Optional[Dict[str, str]],
+                           content_encoding: Optional[str] = None) -> str:
+        """Upload local file to GCS."""
         blob = self.gcs_bucket.blob(key)
+        blob.content_encoding = content_encoding
         
-        if metadata:
-            blob.metadata = metadata
+        blob.metadata = self._build_metadata(metadata)
         
-        blob.metadata = blob.metadata or {}
-        blob.metadata.update({
-            'uploaded_at': datetime.now().isoformat(),
-            'source': 'covid-etl-pipeline'
-        })
-        
-        blob.upload_from_file(file_obj, content_type=content_type)
+        if file_path.stat().st_size > _GCS_PARALLEL_THRESHOLD:
+            self._upload_gcs_chunks_concurrently(blob, str(file_path), content_type)
+        else:
+            blob.upload_from_filename(str(file_path), content_type=content_type)
         return f"gs://{self.bucket_name}/{key}"
     
+    def _upload_gcs_chunks_concurrently(self, blob: gcs.Blob, filename: str,
+                                        content_type: str) -> None:
+        """Upload a large local file to GCS as parallel chunks composed server-side."""
+        self.logger.info(f"Uploading {blob.name} to GCS in concurrent chunks")
+        transfer_manager.upload_chunks_concurrently(
+            filename, blob,
+            content_type=content_type,
+            chunk_size=_GCS_CHUNK_SIZE,
+            max_workers=_GCS_MAX_WORKERS,
+            worker_type=transfer_manager.THREAD
+        )
+    
     def upload_multiple_dataframes(self, data: Dict[str, pd.DataFrame],
-                                  prefix: str = '', file_format: str = 'parquet') -> Dict[str, str]:
+                                  prefix: str = '', file_format: str = 'parquet',
+                                  max_workers: Optional[int] = None,
+                                  use_async: bool = False) -> Dict[str, str]:
         """
-        Upload multiple DataFrames to cloud storage.
+        Upload multiple DataFrames to cloud storage concurrently.
         
         Args:
             data: Dictionary of DataFrames {name: df}
             prefix: Key prefix for organization
             file_format: File format for all uploads
+            max_workers: Maximum concurrent uploads (default: min(8, number of datasets))
+            use_async: Upload S3 batches on an aiobotocore event loop instead of
+                threads. The async path serializes each file into memory and
+                does not retry after bucket errors, so it is opt-in
             
         Returns:
             Dictionary mapping data name to storage URL
         """
         uploaded_files = {}
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        uploaded_at = now.isoformat()
         
+        uploads = []
         for data_name, df in data.items():
             if df.empty:
                 self.logger.warning(f"Skipping empty DataFrame: {data_name}")
@@ -297,20 +888,73 @@ class CloudStorageLoader:
                 'data_type': data_name,
                 'record_count': str(len(df)),
                 'column_count': str(len(df.columns)),
-                'file_format': file_format
+                'file_format': file_format,
+                'uploaded_at': uploaded_at
             }
             
-            try:
-                storage_url = self.upload_dataframe(df, key, file_format, metadata)
-                uploaded_files[data_name] = storage_url
+            uploads.append((data_name, key, df, metadata))
+        
+        max_workers = max_workers or max(1, min(8, len(uploads)))
+        
+        if uploads and use_async and self._can_upload_async():
+            # One event loop multiplexes every file and part over a shared client
+            results = asyncio.run(self._aupload_many(uploads, file_format, max_workers))
+            for data_name, result in results.items():
+                if isinstance(result, Exception):
+                    self.logger.error(f"Failed to upload {data_name}: {str(result)}")
+                else:
+                    uploaded_files[data_name] = result
+        else:
+            # Uploads are network-bound, so threads overlap them well; the
+            # storage clients are created once and shared across workers
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.upload_dataframe, df, key, file_format, metadata): data_name
+                    for data_name, key, df, metadata in uploads
+                }
                 
-            except Exception as e:
-                self.logger.error(f"Failed to upload {data_name}: {str(e)}")
-                continue
+                for future in as_completed(futures):
+                    data_name = futures[future]
+                    try:
+                        uploaded_files[data_name] = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Failed to upload {data_name}: {str(e)}")
         
         self.logger.info(f"Successfully uploaded {len(uploaded_files)} datasets")
         return uploaded_files
     
+    def _can_upload_async(self) -> bool:
+        """Check whether batch uploads can run on a private aiobotocore event loop."""
+        if self.provider != 'aws' or get_aio_session is None:
+            return False
+        
+        # asyncio.run cannot be nested inside a running loop
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+    
+    async def _aupload_many(self, uploads: List[Tuple[str, str, pd.DataFrame, Dict[str, str]]],
+                            file_format: str,
+                            max_workers: int) -> Dict[str, Union[str, Exception]]:
+        """Upload prepared datasets concurrently, returning a URL or exception per dataset."""
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async with self._create_aio_s3_client() as s3_client:
+            async def upload_one(key: str, df: pd.DataFrame, metadata: Dict[str, str]) -> str:
+                async with semaphore:
+                    return await self.aupload_dataframe(df, key, file_format, metadata,
+                                                        s3_client=s3_client)
+            
+            results = await asyncio.gather(
+                *(upload_one(key, df, metadata) for _, key, df, metadata in uploads),
+                return_exceptions=True
+            )
+        
+        return {upload[0]: result for upload, result in zip(uploads, results)}
+    
+    @_log_and_raise("Failed to list objects: {err}")
     def list_objects(self, prefix: str = '') -> List[Dict[str, Any]]:
         """
         List objects in cloud storage.
@@ -321,50 +965,49 @@ class CloudStorageLoader:
         Returns:
             List of object information
         """
-        try:
-            if self.provider == 'aws':
-                return self._list_s3_objects(prefix)
-            elif self.provider == 'gcp':
-                return self._list_gcs_objects(prefix)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to list objects: {str(e)}")
-            raise
+        return list(self._iter_objects(prefix))
     
-    def _list_s3_objects(self, prefix: str) -> List[Dict[str, Any]]:
-        """List S3 objects."""
-        objects = []
-        
+    def _iter_objects(self, prefix: str = '') -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over objects in cloud storage."""
+        if self.provider == 'aws':
+            return self._iter_s3_objects(prefix)
+        elif self.provider == 'gcp':
+            return self._iter_gcs_objects(prefix)
+        return iter(())
+    
+    def _iter_s3_objects(self, prefix: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over S3 objects page by page."""
         paginator = self.s3_client.get_paginator('list_objects_v2')
-        pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+        pages = paginator.paginate(
+            Bucket=self.bucket_name, Prefix=prefix,
+            PaginationConfig={'PageSize': _LIST_PAGE_SIZE}
+        )
         
         for page in pages:
-            if 'Contents' in page:
-                for obj in page['Contents']:
-                    objects.append({
-                        'key': obj['Key'],
-                        'size': obj['Size'],
-                        'last_modified': obj['LastModified'],
-                        'etag': obj['ETag']
-                    })
-        
-        return objects
+            for obj in page.get('Contents', []):
+                yield {
+                    'key': obj.get('Key'),
+                    'size': obj.get('Size'),
+                    'last_modified': obj.get('LastModified'),
+                    'etag': obj.get('ETag')
+                }
     
-    def _list_gcs_objects(self, prefix: str) -> List[Dict[str, Any]]:
-        """List GCS objects."""
-        objects = []
-        
-        blobs = self.gcs_bucket.list_blobs(prefix=prefix)
+    def _iter_gcs_objects(self, prefix: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over GCS objects page by page."""
+        # Only request the fields that are returned below
+        blobs = self.gcs_bucket.list_blobs(
+            prefix=prefix,
+            fields='items(name,size,timeCreated,etag),nextPageToken',
+            page_size=_LIST_PAGE_SIZE
+        )
         
         for blob in blobs:
-            objects.append({
+            yield {
                 'key': blob.name,
                 'size': blob.size,
                 'last_modified': blob.time_created,
                 'etag': blob.etag
-            })
-        
-        return objects
+            }
     
     def delete_object(self, key: str) -> bool:
         """
@@ -376,20 +1019,83 @@ class CloudStorageLoader:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if self.provider == 'aws':
-                self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
-            elif self.provider == 'gcp':
-                blob = self.gcs_bucket.blob(key)
-                blob.delete()
-            
-            self.logger.info(f"Successfully deleted object: {key}")
-            return True
+        return key in self.delete_objects([key])
+    
+    def delete_objects(self, keys: List[str]) -> List[str]:
+        """
+        Delete objects from cloud storage in batches.
+        
+        S3 deletes up to 1000 keys per DeleteObjects request; GCS sends up to
+        100 deletes per batch request. Keys are reported per object, so one
+        failed delete does not hide the others in its batch; keys that do
+        not exist count as deleted, matching S3.
+        
+        Args:
+            keys: Object keys to delete
             
+        Returns:
+            Keys that were deleted
+        """
+        keys = list(keys)
+        deleted = []
+        
+        batch_size = _S3_DELETE_BATCH_SIZE if self.provider == 'aws' else _GCS_DELETE_BATCH_SIZE
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start:start + batch_size]
+            try:
+                if self.provider == 'aws':
+                    deleted.extend(self._delete_s3_batch(chunk))
+                elif self.provider == 'gcp':
+                    deleted.extend(self._delete_gcs_batch(chunk))
+                    
+            except Exception as e:
+                self.logger.error(f"Failed to delete batch of {len(chunk)} objects: {str(e)}")
+        
+        self.logger.info(f"Successfully deleted {len(deleted)} of {len(keys)} objects")
+        return deleted
+    
+    def _delete_s3_batch(self, keys: List[str]) -> List[str]:
+        """Delete up to 1000 S3 keys in one request and return the deleted keys."""
+        response = self.s3_client.delete_objects(
+            Bucket=self.bucket_name,
+            Delete={'Objects': [{'Key': key} for key in keys]}
+        )
+        
+        for error in response.get('Errors', []):
+            self.logger.error(f"Failed to delete object {error.get('Key')}: {error.get('Message')}")
+        
+        return [obj['Key'] for obj in response.get('Deleted', [])]
+    
+    def _delete_gcs_batch(self, keys: List[str]) -> List[str]:
+        """
+        Delete up to 100 GCS keys in one batch request and return the deleted keys.
+        
+        A batch raises only after every sub-request has run, so on failure
+        each key is deleted again on its own. As with S3, a key that no
+        longer exists counts as deleted.
+        """
+        try:
+            with self.gcs_client.batch():
+                for key in keys:
+                    self.gcs_bucket.blob(key).delete()
+            return list(keys)
         except Exception as e:
-            self.logger.error(f"Failed to delete object {key}: {str(e)}")
-            return False
+            self.logger.warning(f"Batch delete reported an error, retrying per object: {str(e)}")
+        
+        deleted = []
+        for key in keys:
+            try:
+                self.gcs_bucket.delete_blob(key)
+            except gcp_exceptions.NotFound:
+                pass  # Already removed, possibly by the batch above
+            except Exception as e:
+                self.logger.error(f"Failed to delete object {key}: {str(e)}")
+                continue
+            deleted.append(key)
+        
+        return deleted
     
+    @_log_and_raise("Failed to download DataFrame from {key}: {err}")
     def download_dataframe(self, key: str, file_format: str = 'parquet') -> pd.DataFrame:
         """
         Download DataFrame from cloud storage.
@@ -401,39 +1107,48 @@ class CloudStorageLoader:
         Returns:
             Downloaded DataFrame
         """
-        try:
-            self.logger.info(f"Downloading DataFrame from {key}")
-            
-            # Download to buffer
-            buffer = io.BytesIO()
-            
-            if self.provider == 'aws':
-                self.s3_client.download_fileobj(self.bucket_name, key, buffer)
-            elif self.provider == 'gcp':
-                blob = self.gcs_bucket.blob(key)
-                blob.download_to_file(buffer)
-            
-            buffer.seek(0)
-            
-            # Read DataFrame based on format
-            if file_format.lower() == 'parquet':
-                df = pd.read_parquet(buffer)
-            elif file_format.lower() == 'csv':
-                df = pd.read_csv(buffer)
-            elif file_format.lower() == 'json':
-                df = pd.read_json(buffer, orient='records')
-            else:
-                raise ValueError(f"Unsupported file format: {file_format}")
-            
-            self.logger.info(f"Successfully downloaded DataFrame with {len(df)} records")
-            return df
-            
-        except Exception as e:
-            self.logger.error(f"Failed to download DataFrame from {key}: {str(e)}")
-            raise
+        self.logger.info(f"Downloading DataFrame from {key}")
+        
+        # Download to buffer
+        buffer = io.BytesIO()
+        
+        if self.provider == 'aws':
+            self.s3_client.download_fileobj(self.bucket_name, key, buffer)
+        elif self.provider == 'gcp':
+            blob = self.gcs_bucket.blob(key)
+            # Keep gzip-encoded objects compressed; they are decoded below
+            blob.download_to_file(buffer, raw_download=True)
+        
+        buffer.seek(0)
+        compression = 'gzip' if key.endswith('.gz') else None
+        
+        # Read DataFrame based on format
+        if file_format.lower() == 'parquet':
+            df = pd.read_parquet(buffer)
+        elif file_format.lower() == 'csv':
+            df = pd.read_csv(buffer, compression=compression)
+        elif file_format.lower() == 'json':
+            df = pd.read_json(buffer, orient='records', compression=compression)
+        else:
+            raise ValueError(f"Unsupported file format: {file_format}")
+        
+        self.logger.info(f"Successfully downloaded DataFrame with {len(df)} records")
+        return df
     
-    def _get_content_type(self, file_extension: str) -> str:
-        """Get content type based on file extension."""
+    def _get_content_type(self, filename: str) -> Tuple[str, Optional[str]]:
+        """
+        Get content type and content encoding based on file name.
+        
+        A trailing '.gz' maps to a gzip content encoding, with the content
+        type taken from the preceding extension (e.g. 'data.csv.gz').
+        """
+        suffixes = Path(filename).suffixes
+        content_encoding = None
+        if suffixes and suffixes[-1].lower() == '.gz':
+            content_encoding = 'gzip'
+            suffixes = suffixes[:-1]
+        
+        file_extension = suffixes[-1] if suffixes else ''
         content_types = {
             '.csv': 'text/csv',
             '.json': 'application/json',
@@ -442,7 +1157,7 @@ class CloudStorageLoader:
             '.log': 'text/plain'
         }
         
-        return content_types.get(file_extension.lower(), 'application/octet-stream')
+        return content_types.get(file_extension.lower(), 'application/octet-stream'), content_encoding
     
     def get_storage_info(self) -> Dict[str, Any]:
         """
@@ -458,13 +1173,22 @@ class CloudStorageLoader:
                 'timestamp': datetime.now().isoformat()
             }
             
-            # Get bucket statistics
-            objects = self.list_objects()
+            # Get bucket statistics in a single pass over the listing
+            total_objects = 0
+            total_size = 0
+            last_modified = None
+            
+            for obj in self._iter_objects():
+                total_objects += 1
+                total_size += obj['size'] or 0
+                modified = obj['last_modified']
+                if modified is not None and (last_modified is None or modified > last_modified):
+                    last_modified = modified
             
             info.update({
-                'total_objects': len(objects),
-                'total_size_bytes': sum(obj['size'] for obj in objects),
-                'last_modified': max(obj['last_modified'] for obj in objects) if objects else None
+                'total_objects': total_objects,
+                'total_size_bytes': total_size,
+                'last_modified': last_modified
             })
             
             return info
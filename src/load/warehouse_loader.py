@@ -3,17 +3,158 @@ Data warehouse loader for COVID-19 ETL Pipeline.
 Supports Amazon Redshift and Google BigQuery.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import s3fs
 import sqlalchemy
+from google.api_core import exceptions as gcp_exceptions
 from google.cloud import bigquery
+from google.oauth2 import service_account
 import psycopg2
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
+import io
 import json
+import time
+import uuid
+
+try:
+    from google.cloud import bigquery_storage_v1
+    from google.cloud.bigquery_storage_v1 import types as bq_storage_types
+except ImportError:
+    bigquery_storage_v1 = None
+    bq_storage_types = None
+
+try:
+    import pgpq
+except ImportError:
+    pgpq = None
 
 from ..utils.config import config
 from ..utils.logger import get_logger
 
+# Rows rendered at a time while streaming a COPY
+_COPY_CHUNK_ROWS = 50000
+
+# Characters (or bytes) requested per read by psycopg2 while copying
+_COPY_READ_SIZE = 1 << 20
+
+# Rows fetched per round trip when materializing Redshift query results
+_FETCH_ROWS = 50000
+
+# Redshift loads above this in-memory size are staged as parquet in S3 and
+# ingested with COPY, which the cluster runs in parallel across slices
+_S3_COPY_THRESHOLD = 200 << 20
+
+# Parquet files staged per S3 COPY, so every slice has a file to ingest
+_S3_COPY_FILES = 16
+
+# BigQuery appends below this many rows use the Storage Write API, which
+# avoids the per-table daily load job quota; larger frames use load jobs
+_BQ_LOAD_THRESHOLD = 500000
+
+# Rows per Arrow record batch sent in one AppendRows request
+_BQ_APPEND_ROWS = 10000
+
+# Arrow-format AppendRows is missing from older bigquery-storage releases
+_BQ_ARROW_APPENDS = (bq_storage_types is not None
+                     and hasattr(bq_storage_types.AppendRowsRequest, 'ArrowData'))
+
+# Upper bound on pending streams written concurrently for one table
+_BQ_MAX_STREAMS = 4
+
+# Seconds a fetched BigQuery table object is reused for table info
+_BQ_TABLE_TTL = 60
+
+# BigQuery parameter types by Python type; anything else is bound as STRING
+_BQ_PARAM_TYPES = {
+    bool: 'BOOL',
+    int: 'INT64',
+    float: 'FLOAT64',
+    Decimal: 'NUMERIC',
+    datetime: 'TIMESTAMP',
+    pd.Timestamp: 'TIMESTAMP',
+    date: 'DATE',
+    bytes: 'BYTES',
+    str: 'STRING'
+}
+
+# Per-table statements, rendered once per table by _table_sql
+_SQL_TEMPLATES = {
+    'drop': "DROP TABLE IF EXISTS {table}",
+    'count': "SELECT '{name}' AS table_name, COUNT(*) AS record_count FROM {table}"
+}
+
+# Upper bound on tables loaded concurrently by load_multiple_dataframes
+_MAX_LOAD_WORKERS = 8
+
+
+def _csv_copy_chunks(df: pd.DataFrame) -> Iterator[str]:
+    """Render DataFrame rows as tab-separated CSV for COPY, one window at a time."""
+    for start in range(0, len(df), _COPY_CHUNK_ROWS):
+        yield df.iloc[start:start + _COPY_CHUNK_ROWS].to_csv(
+            index=False, header=False, sep='\t', na_rep='\\N'
+        )
+
+
+def _binary_copy_chunks(table: pa.Table, encoder: Any) -> Iterator[bytes]:
+    """Encode an Arrow table in Postgres binary COPY format, one record batch at a time."""
+    yield encoder.write_header()
+    for batch in table.to_batches(max_chunksize=_COPY_CHUNK_ROWS):
+        yield encoder.write_batch(batch)
+    yield encoder.finish()
+
+
+class _CopyStream(io.IOBase):
+    """
+    Readable stream over lazily rendered COPY data.
+    
+    Chunks are rendered as COPY reads, so only a single window of rows is
+    held in memory regardless of DataFrame size. Chunks are either all
+    text (CSV) or all bytes (binary).
+    """
+    
+    def __init__(self, chunks: Iterator[Union[str, bytes]]):
+        self._chunks = chunks
+        self._chunk = None
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: Optional[int] = -1) -> Union[str, bytes]:
+        if size is None:
+            size = -1
+        
+        pieces = []
+        while size != 0:
+            if self._chunk is None or self._pos >= len(self._chunk):
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._chunk = chunk
+                self._pos = 0
+                continue
+            
+            end = len(self._chunk) if size < 0 else self._pos + size
+            piece = self._chunk[self._pos:end]
+            self._pos += len(piece)
+            pieces.append(piece)
+            if size > 0:
+                size -= len(piece)
+        
+        # No chunk was ever rendered: an empty read signals end of data
+        if self._chunk is None:
+            return b''
+        
+        # Join with an empty value of the chunk type (str or bytes)
+        return self._chunk[:0].join(pieces)
+
 
 class DataWarehouseLoader:
     """Loader for uploading data to data warehouses (Redshift or BigQuery)."""
@@ -30,6 +171,24 @@ class DataWarehouseLoader:
         
         self.provider = provider or self.db_config.get('provider', 'redshift')
         
+        # BigQuery table references, schemas (fetched once per table) and
+        # table objects (reused for _BQ_TABLE_TTL seconds)
+        self._table_ref_cache = {}
+        self._schema_cache = {}
+        self._table_cache = {}
+        
+        # Load job configs keyed by (if_exists, table name)
+        self._job_configs = {}
+        self._bq_write_client = None
+        self._gcp_credentials = None
+        self._s3fs = None
+        
+        # Redshift tables whose column types rejected binary COPY
+        self._text_copy_tables = set()
+        
+        # Rendered per-table SQL, keyed by (statement, table name)
+        self._sql_cache = {}
+        
         # Initialize warehouse client
         if self.provider == 'redshift':
             self._init_redshift_client()
@@ -38,6 +197,12 @@ class DataWarehouseLoader:
         else:
             raise ValueError(f"Unsupported warehouse provider: {self.provider}")
         
+        # Qualifier prepended to table names in generated SQL
+        if self.provider == 'redshift':
+            self._schema_prefix = f"{self.schema}."
+        else:
+            self._schema_prefix = f"`{self.dataset_id}`."
+        
         self.logger.info(f"Initialized {self.provider.upper()} warehouse loader")
     
     def _init_redshift_client(self) -> None:
@@ -65,10 +230,18 @@ class DataWarehouseLoader:
                 f"/{connection_params['database']}"
             )
             
+            # One engine per loader; the pool is sized for concurrent table loads.
+            # Batch executemany so the to_sql fallback does not send row-by-row statements
             self.engine = sqlalchemy.create_engine(
                 connection_string,
+                poolclass=sqlalchemy.pool.QueuePool,
+                pool_size=_MAX_LOAD_WORKERS,
+                max_overflow=_MAX_LOAD_WORKERS,
                 pool_pre_ping=True,
-                pool_recycle=3600
+                pool_recycle=1800,
+                executemany_mode='values_plus_batch',
+                insertmanyvalues_page_size=10000,
+                executemany_batch_page_size=500
             )
             
             # Test connection
@@ -92,10 +265,15 @@ class DataWarehouseLoader:
             if gcp_config.get('project_id'):
                 client_kwargs['project'] = gcp_config['project_id']
             
-            # Set credentials if specified
+            # Load the key file explicitly instead of exporting
+            # GOOGLE_APPLICATION_CREDENTIALS for the whole process; the
+            # Storage Write client reuses these credentials
             if gcp_config.get('credentials_path'):
-                import os
-                os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = gcp_config['credentials_path']
+                self._gcp_credentials = service_account.Credentials.from_service_account_file(
+                    gcp_config['credentials_path']
+                )
+                client_kwargs['credentials'] = self._gcp_credentials
+                client_kwargs.setdefault('project', self._gcp_credentials.project_id)
             
             self.bq_client = bigquery.Client(**client_kwargs)
             self.dataset_id = self.db_config.get('dataset_id', 'covid_data')
@@ -112,7 +290,7 @@ class DataWarehouseLoader:
     def _ensure_bigquery_dataset(self) -> None:
         """Ensure BigQuery dataset exists."""
         try:
-            dataset_ref = self.bq_client.dataset(self.dataset_id)
+            dataset_ref = bigquery.DatasetReference(self.bq_client.project, self.dataset_id)
             self.bq_client.get_dataset(dataset_ref)
             self.logger.info(f"BigQuery dataset {self.dataset_id} exists")
             
@@ -154,14 +332,12 @@ class DataWarehouseLoader:
     def _create_redshift_table(self, table_name: str, schema_sql: str) -> bool:
         """Create table in Redshift."""
         try:
-            with self.engine.connect() as conn:
+            with self.engine.begin() as conn:
                 # Drop table if exists (for development)
-                drop_sql = f"DROP TABLE IF EXISTS {self.schema}.{table_name}"
-                conn.execute(sqlalchemy.text(drop_sql))
+                conn.execute(sqlalchemy.text(self._table_sql('drop', table_name)))
                 
                 # Create table
                 conn.execute(sqlalchemy.text(schema_sql))
-                conn.commit()
             
             self.logger.info(f"Successfully created Redshift table: {table_name}")
             return True
@@ -177,7 +353,8 @@ class DataWarehouseLoader:
             # This is a simplified approach - in practice, you'd parse the SQL
             # and convert to BigQuery schema format
             
-            table_ref = self.bq_client.dataset(self.dataset_id).table(table_name)
+            table_ref = self._table_ref(table_name)
+            self._invalidate_table(table_name)
             
             # Check if table exists
             try:
@@ -199,7 +376,7 @@ class DataWarehouseLoader:
             return False
     
     def load_dataframe(self, df: pd.DataFrame, table_name: str,
-                      if_exists: str = 'append', method: str = 'multi') -> bool:
+                      if_exists: str = 'append', method: Optional[str] = None) -> bool:
         """
         Load DataFrame into data warehouse table.
         
@@ -207,17 +384,36 @@ class DataWarehouseLoader:
             df: DataFrame to load
             table_name: Target table name
             if_exists: What to do if table exists ('fail', 'replace', 'append')
-            method: Loading method
+            method: Redshift loading method passed to pandas to_sql. None
+                (the default) uses executemany, which the engine batches
+                with executemany_mode='values_plus_batch'; 'multi' sends
+                multi-row INSERTs. 'copy' streams
+                COPY FROM STDIN and is only for Postgres-compatible
+                endpoints; Redshift itself rejects FROM STDIN
             
         Returns:
             True if successful, False otherwise
         """
+        num_rows = len(df.index)
+        
+        # Nothing to write unless an empty frame is meant to replace the table
+        if num_rows == 0 and if_exists != 'replace':
+            self.logger.info(f"No records to load to table: {table_name}")
+            return True
+        
         try:
-            self.logger.info(f"Loading {len(df)} records to table: {table_name}")
+            self.logger.info(f"Loading {num_rows} records to table: {table_name}")
             
             if self.provider == 'redshift':
+                # Large frames use Redshift's native COPY from S3 when an IAM role is set
+                if (self.db_config.get('iam_role')
+                        and df.memory_usage().sum() > _S3_COPY_THRESHOLD):
+                    return self._load_to_redshift_via_s3(df, table_name, if_exists)
                 return self._load_to_redshift(df, table_name, if_exists, method)
             elif self.provider == 'bigquery':
+                if (if_exists == 'append' and num_rows < _BQ_LOAD_THRESHOLD
+                        and _BQ_ARROW_APPENDS):
+                    return self._load_to_bigquery_storage_write(df, table_name)
                 return self._load_to_bigquery(df, table_name, if_exists)
             
         except Exception as e:
@@ -228,19 +424,37 @@ class DataWarehouseLoader:
                          if_exists: str, method: str) -> bool:
         """Load DataFrame to Redshift."""
         try:
-            # Prepare DataFrame for loading
-            df_prepared = self._prepare_dataframe_for_redshift(df)
-            
-            # Load using pandas to_sql
-            df_prepared.to_sql(
-                name=table_name,
-                con=self.engine,
-                schema=self.schema,
-                if_exists=if_exists,
-                index=False,
-                method=method,
-                chunksize=10000  # Load in chunks for better performance
-            )
+            if method == 'copy':
+                # DDL and COPY share one transaction, so a failed COPY also
+                # rolls back the drop/create of a replace
+                with self.engine.begin() as conn:
+                    # An empty to_sql applies if_exists and creates a missing
+                    # table, typed from the original frame so binary COPY fits it
+                    df.head(0).to_sql(
+                        name=table_name,
+                        con=conn,
+                        schema=self.schema,
+                        if_exists=if_exists,
+                        index=False
+                    )
+                    self._copy_to_redshift(conn, df, table_name)
+            else:
+                # Prepare DataFrame for loading
+                df_prepared = self._prepare_dataframe_for_redshift(df)
+                
+                # Keep bound parameters per chunk under the Postgres protocol limit
+                chunksize = max(1, min(50000, 32000 // max(1, len(df_prepared.columns))))
+                
+                # Load using pandas to_sql
+                df_prepared.to_sql(
+                    name=table_name,
+                    con=self.engine,
+                    schema=self.schema,
+                    if_exists=if_exists,
+                    index=False,
+                    method=method,
+                    chunksize=chunksize
+                )
             
             self.logger.info(f"Successfully loaded {len(df)} records to Redshift table: {table_name}")
             return True
@@ -249,31 +463,167 @@ class DataWarehouseLoader:
             self.logger.error(f"Redshift load failed for {table_name}: {str(e)}")
             return False
     
+    def _load_to_redshift_via_s3(self, df: pd.DataFrame, table_name: str,
+                                 if_exists: str) -> bool:
+        """
+        Load a large DataFrame by staging parquet files in S3 and running COPY.
+        
+        The frame is split into _S3_COPY_FILES files so Redshift ingests them
+        in parallel. Staged files are removed after the load. Table DDL and
+        COPY run in one transaction, so a failed 'replace' keeps the old rows.
+        """
+        bucket = config.get_storage_config().get('bucket')
+        staging_prefix = self.db_config.get('staging_prefix', 'staging/redshift/')
+        staging_path = f"{bucket}/{staging_prefix}{table_name}/{uuid.uuid4().hex}"
+        fs = self._get_s3fs()
+        
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            rows_per_file = max(1, -(-table.num_rows // _S3_COPY_FILES))
+            ds.write_dataset(
+                table, staging_path,
+                format='parquet',
+                filesystem=fs,
+                basename_template='part-{i}.parquet',
+                max_rows_per_file=rows_per_file,
+                max_rows_per_group=min(rows_per_file, 1 << 20)
+            )
+            
+            copy_sql = (
+                f"COPY {self._schema_prefix}{table_name} FROM 's3://{staging_path}/' "
+                f"IAM_ROLE '{self.db_config['iam_role']}' FORMAT AS PARQUET"
+            )
+            # Files are staged before the table is touched, and the DDL and
+            # COPY share one transaction, so a failure leaves the table as it was
+            with self.engine.begin() as conn:
+                # An empty to_sql applies if_exists and creates a missing table
+                df.head(0).to_sql(
+                    name=table_name,
+                    con=conn,
+                    schema=self.schema,
+                    if_exists=if_exists,
+                    index=False
+                )
+                conn.execute(sqlalchemy.text(copy_sql))
+            
+            self.logger.info(f"Successfully loaded {len(df)} records to Redshift table via S3: {table_name}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Redshift S3 COPY failed for {table_name}: {str(e)}")
+            return False
+            
+        finally:
+            try:
+                fs.rm(staging_path, recursive=True)
+            except FileNotFoundError:
+                pass
+    
+    def _get_s3fs(self) -> s3fs.S3FileSystem:
+        """Get S3 filesystem used for staging COPY files, created on first use."""
+        if self._s3fs is None:
+            aws_config = config.get_aws_config()
+            
+            fs_kwargs = {}
+            if aws_config.get('access_key_id') and aws_config.get('secret_access_key'):
+                fs_kwargs.update({
+                    'key': aws_config['access_key_id'],
+                    'secret': aws_config['secret_access_key']
+                })
+            
+            if aws_config.get('region'):
+                fs_kwargs['client_kwargs'] = {'region_name': aws_config['region']}
+            
+            self._s3fs = s3fs.S3FileSystem(**fs_kwargs)
+        
+        return self._s3fs
+    
+    def _copy_to_redshift(self, conn: sqlalchemy.engine.Connection,
+                          df: pd.DataFrame, table_name: str) -> None:
+        """
+        Stream DataFrame rows into an existing table with COPY FROM STDIN.
+        
+        Rows travel as one COPY stream instead of parsed INSERT statements,
+        rendered in windows of _COPY_CHUNK_ROWS rows to cap memory. Binary
+        format is used when pgpq is installed and is encoded from the typed
+        frame; the Redshift text formatting is only applied for the CSV
+        fallback, used when the table's column types do not match the binary
+        encoding. The COPY runs in the caller's transaction on conn, which
+        commits or rolls it back.
+        """
+        columns = ', '.join('"{}"'.format(str(col).replace('"', '""')) for col in df.columns)
+        target = f"{self._schema_prefix}{table_name} ({columns})"
+        
+        if pgpq is not None and table_name not in self._text_copy_tables:
+            arrow_table, encoder = self._binary_encoder(df)
+            
+            if encoder is not None:
+                try:
+                    # A savepoint keeps the transaction usable for the CSV retry
+                    with conn.begin_nested():
+                        self._run_copy(conn, f"COPY {target} FROM STDIN WITH (FORMAT BINARY)",
+                                       _binary_copy_chunks(arrow_table, encoder))
+                    return
+                except psycopg2.DataError as e:
+                    self.logger.warning(f"Binary COPY rejected for {table_name}, using CSV: {str(e)}")
+                    self._text_copy_tables.add(table_name)
+        
+        self._run_copy(
+            conn,
+            f"COPY {target} FROM STDIN WITH (FORMAT CSV, DELIMITER E'\\t', NULL '\\N')",
+            _csv_copy_chunks(self._prepare_dataframe_for_redshift(df))
+        )
+    
+    def _binary_encoder(self, df: pd.DataFrame) -> Tuple[Optional[pa.Table], Any]:
+        """Convert a typed frame to Arrow and build its binary COPY encoder, or return Nones."""
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            
+            # Categoricals arrive as dictionary arrays; COPY needs plain values
+            schema = pa.schema([
+                field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type) else field
+                for field in table.schema
+            ])
+            if not schema.equals(table.schema):
+                table = table.cast(schema)
+            
+            return table, pgpq.ArrowToPostgresBinaryEncoder(table.schema)
+        except Exception as e:
+            # Mixed-type object columns or types pgpq cannot encode
+            self.logger.debug(f"Binary COPY unavailable, using CSV: {str(e)}")
+            return None, None
+    
+    def _run_copy(self, conn: sqlalchemy.engine.Connection, copy_sql: str,
+                  chunks: Iterator[Union[str, bytes]]) -> None:
+        """Run a COPY FROM STDIN statement on the DBAPI connection behind conn."""
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(copy_sql, _CopyStream(chunks), size=_COPY_READ_SIZE)
+    
     def _load_to_bigquery(self, df: pd.DataFrame, table_name: str, if_exists: str) -> bool:
         """Load DataFrame to BigQuery."""
         try:
             # Prepare DataFrame for BigQuery
             df_prepared = self._prepare_dataframe_for_bigquery(df)
             
-            table_ref = self.bq_client.dataset(self.dataset_id).table(table_name)
+            table_ref = self._table_ref(table_name)
+            job_config = self._get_load_job_config(table_name, if_exists)
             
-            # Configure load job
-            job_config = bigquery.LoadJobConfig()
+            # Convert to Arrow once and write parquet ourselves rather than
+            # letting the client round-trip the DataFrame through a temp file
+            arrow_table = pa.Table.from_pandas(df_prepared, preserve_index=False)
+            buffer = io.BytesIO()
+            pq.write_table(arrow_table, buffer, compression='snappy', use_dictionary=True)
             
-            if if_exists == 'replace':
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
-            elif if_exists == 'append':
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_APPEND
-            else:
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_EMPTY
-            
-            job_config.autodetect = True
+            # Release the Arrow copy before the upload
+            del arrow_table
+            buffer.seek(0)
             
             # Load data
-            job = self.bq_client.load_table_from_dataframe(
-                df_prepared, table_ref, job_config=job_config
+            job = self.bq_client.load_table_from_file(
+                buffer, table_ref, job_config=job_config
             )
             job.result()  # Wait for completion
+            self._table_cache.pop(table_name, None)
             
             self.logger.info(f"Successfully loaded {len(df)} records to BigQuery table: {table_name}")
             return True
@@ -282,36 +632,243 @@ class DataWarehouseLoader:
             self.logger.error(f"BigQuery load failed for {table_name}: {str(e)}")
             return False
     
-    def _prepare_dataframe_for_redshift(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Prepare DataFrame for Redshift loading."""
-        df_prepared = df.copy()
+    def _get_load_job_config(self, table_name: str, if_exists: str) -> bigquery.LoadJobConfig:
+        """
+        Get the load job config for a table and write disposition.
         
-        # Handle datetime columns
-        datetime_cols = df_prepared.select_dtypes(include=['datetime64']).columns
-        for col in datetime_cols:
-            df_prepared[col] = df_prepared[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+        Configs ship parquet against the table's known schema instead of
+        re-inferring it, and are built once per table and disposition. A
+        config for a table that does not exist yet is not cached, so the
+        schema is picked up once the first load creates the table.
+        """
+        if if_exists == 'replace':
+            # The table may be replaced with a different shape
+            self._invalidate_table(table_name)
         
-        # Handle boolean columns (Redshift doesn't have native boolean)
-        bool_cols = df_prepared.select_dtypes(include=['bool']).columns
-        for col in bool_cols:
-            df_prepared[col] = df_prepared[col].astype(int)
+        key = (if_exists, table_name)
+        job_config = self._job_configs.get(key)
+        if job_config is not None:
+            return job_config
         
-        # Handle NaN values
-        df_prepared = df_prepared.fillna('')
+        # Configure load job
+        job_config = bigquery.LoadJobConfig()
         
-        return df_prepared
+        if if_exists == 'replace':
+            job_config.write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
+        elif if_exists == 'append':
+            job_config.write_disposition = bigquery.WriteDisposition.WRITE_APPEND
+        else:
+            job_config.write_disposition = bigquery.WriteDisposition.WRITE_EMPTY
+        
+        job_config.source_format = bigquery.SourceFormat.PARQUET
+        job_config.autodetect = False
+        
+        # Replaced tables take their schema from the parquet file
+        if if_exists != 'replace':
+            schema = self._get_bigquery_schema(table_name)
+            if schema is None:
+                return job_config
+            job_config.schema = schema
+        
+        self._job_configs[key] = job_config
+        return job_config
+    
+    def _load_to_bigquery_storage_write(self, df: pd.DataFrame, table_name: str) -> bool:
+        """
+        Append DataFrame to BigQuery through a pending Storage Write API stream.
+        
+        Rows are split across up to _BQ_MAX_STREAMS streams appended
+        concurrently, sent as Arrow record batches, and become visible
+        atomically when all streams are committed together. Missing tables
+        fall back to a load job, which creates them, and so does any failure:
+        uncommitted streams load nothing, so the retry cannot duplicate rows.
+        """
+        try:
+            if self._get_bigquery_schema(table_name) is None:
+                return self._load_to_bigquery(df, table_name, 'append')
+            
+            df_prepared = self._prepare_dataframe_for_bigquery(df)
+            arrow_table = pa.Table.from_pandas(df_prepared, preserve_index=False)
+            
+            write_client = self._get_bq_write_client()
+            parent = write_client.table_path(self.bq_client.project, self.dataset_id, table_name)
+            
+            # Zero-copy row slices, one per stream
+            num_rows = arrow_table.num_rows
+            num_streams = max(1, min(_BQ_MAX_STREAMS, -(-num_rows // _BQ_APPEND_ROWS)))
+            rows_per_stream = max(1, -(-num_rows // num_streams))
+            parts = [
+                arrow_table.slice(start, rows_per_stream)
+                for start in range(0, max(num_rows, 1), rows_per_stream)
+            ]
+            
+            with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+                stream_names = list(executor.map(
+                    lambda part: self._write_pending_stream(write_client, parent, part), parts
+                ))
+            
+            # Uncommitted pending streams are discarded, so a failure above loads nothing
+            commit = write_client.batch_commit_write_streams(
+                bq_storage_types.BatchCommitWriteStreamsRequest(
+                    parent=parent, write_streams=stream_names
+                )
+            )
+            if commit.stream_errors:
+                raise RuntimeError(f"Write stream commit failed: {commit.stream_errors}")
+            self._table_cache.pop(table_name, None)
+            
+            self.logger.info(f"Successfully appended {len(df)} records to BigQuery table: {table_name}")
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"BigQuery storage write failed for {table_name}, "
+                                f"using a load job: {str(e)}")
+            return self._load_to_bigquery(df, table_name, 'append')
+    
+    def _write_pending_stream(self, write_client: Any, parent: str,
+                              arrow_table: pa.Table) -> str:
+        """Write an Arrow table to a new pending stream, finalize it, and return its name."""
+        write_stream = write_client.create_write_stream(
+            parent=parent,
+            write_stream=bq_storage_types.WriteStream(
+                type_=bq_storage_types.WriteStream.Type.PENDING
+            )
+        )
+        
+        self._append_arrow_rows(write_client, write_stream.name, arrow_table)
+        write_client.finalize_write_stream(name=write_stream.name)
+        return write_stream.name
+    
+    def _append_arrow_rows(self, write_client: Any, stream_name: str,
+                           arrow_table: pa.Table) -> None:
+        """Append an Arrow table to a write stream as offset-tracked record batches."""
+        serialized_schema = arrow_table.schema.serialize().to_pybytes()
+        
+        def requests():
+            offset = 0
+            for batch in arrow_table.to_batches(max_chunksize=_BQ_APPEND_ROWS):
+                arrow_data = bq_storage_types.AppendRowsRequest.ArrowData(
+                    rows=bq_storage_types.ArrowRecordBatch(
+                        serialized_record_batch=batch.serialize().to_pybytes(),
+                        row_count=batch.num_rows
+                    )
+                )
+                # The writer schema only needs to be sent once per connection
+                if offset == 0:
+                    arrow_data.writer_schema = bq_storage_types.ArrowSchema(
+                        serialized_schema=serialized_schema
+                    )
+                
+                yield bq_storage_types.AppendRowsRequest(
+                    write_stream=stream_name, offset=offset, arrow_rows=arrow_data
+                )
+                offset += batch.num_rows
+        
+        for response in write_client.append_rows(requests()):
+            if response.error.code:
+                raise RuntimeError(f"AppendRows failed: {response.error.message}")
+    
+    def _get_bq_write_client(self) -> Any:
+        """Get BigQuery Storage Write client, created on first use."""
+        if self._bq_write_client is None:
+            self._bq_write_client = bigquery_storage_v1.BigQueryWriteClient(
+                credentials=self._gcp_credentials
+            )
+        return self._bq_write_client
+    
+    def _table_ref(self, table_name: str) -> bigquery.TableReference:
+        """Get a memoized reference to a table in the configured dataset."""
+        table_ref = self._table_ref_cache.get(table_name)
+        if table_ref is None:
+            table_ref = bigquery.TableReference(
+                bigquery.DatasetReference(self.bq_client.project, self.dataset_id), table_name
+            )
+            self._table_ref_cache[table_name] = table_ref
+        return table_ref
+    
+    def _get_bigquery_table(self, table_name: str) -> bigquery.Table:
+        """Get a table object, reusing a fetch made within the last _BQ_TABLE_TTL seconds."""
+        cached = self._table_cache.get(table_name)
+        if cached is not None and time.monotonic() - cached[0] < _BQ_TABLE_TTL:
+            return cached[1]
+        
+        table = self.bq_client.get_table(self._table_ref(table_name))
+        self._table_cache[table_name] = (time.monotonic(), table)
+        return table
+    
+    def _get_bigquery_schema(self, table_name: str) -> Optional[List[bigquery.SchemaField]]:
+        """Get a table's schema from the cache, fetching it once; None if the table does not exist."""
+        schema = self._schema_cache.get(table_name)
+        if schema is None:
+            try:
+                schema = self._get_bigquery_table(table_name).schema
+            except gcp_exceptions.NotFound:
+                return None
+            self._schema_cache[table_name] = schema
+        
+        return schema
+    
+    def _invalidate_table(self, table_name: str) -> None:
+        """Drop cached metadata for a table that is being recreated or replaced."""
+        self._schema_cache.pop(table_name, None)
+        self._table_cache.pop(table_name, None)
+        for if_exists in ('append', 'fail'):
+            self._job_configs.pop((if_exists, table_name), None)
+    
+    def _prepare_dataframe_for_redshift(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Prepare DataFrame for Redshift loading.
+        
+        Builds a new frame from the converted columns, sharing untouched
+        columns with the input instead of copying it. Missing numeric and
+        datetime values stay null and are written with the COPY null marker.
+        """
+        columns = {}
+        for col, values in df.items():
+            dtype = values.dtype
+            
+            if dtype.kind == 'M' and getattr(dtype, 'tz', None) is None:
+                # Handle datetime columns
+                array = values.to_numpy()
+                formatted = np.char.replace(np.datetime_as_string(array, unit='s'), 'T', ' ')
+                columns[col] = np.where(np.isnat(array), None, formatted.astype(object))
+            elif dtype == bool:
+                # Handle boolean columns (Redshift doesn't have native boolean)
+                # astype copies the 1-byte column, so the prepared frame never
+                # aliases the caller's data
+                columns[col] = values.to_numpy().astype(np.int8)
+            elif pd.api.types.is_string_dtype(dtype):
+                # Handle NaN values in text columns (object or Arrow-backed strings)
+                columns[col] = values.fillna('')
+            else:
+                columns[col] = values
+        
+        return pd.DataFrame(columns, index=df.index, copy=False)
     
     def _prepare_dataframe_for_bigquery(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Prepare DataFrame for BigQuery loading."""
-        df_prepared = df.copy()
+        """
+        Prepare DataFrame for BigQuery loading.
+        
+        Works on a shallow copy: converted columns are replaced wholesale and
+        the rest share their buffers with the input frame.
+        """
+        df_prepared = df.copy(deep=False)
         
         # BigQuery handles most data types well, but we need to handle some edge cases
         
-        # Convert object columns that might be mixed types
+        # Convert object columns that might be mixed types. Arrow-backed string
+        # columns from the transformer already carry a string type with nulls
+        # as NA, so they go to parquet as they are
         for col in df_prepared.select_dtypes(include=['object']).columns:
-            # Convert to string to avoid mixed type issues
-            df_prepared[col] = df_prepared[col].astype(str)
-            df_prepared[col] = df_prepared[col].replace('nan', None)
+            values = df_prepared[col]
+            inferred = pd.api.types.infer_dtype(values, skipna=True)
+            
+            if inferred in ('integer', 'floating', 'mixed-integer-float'):
+                # Keep numbers stored as objects numeric so parquet types them correctly
+                df_prepared[col] = pd.to_numeric(values)
+            elif inferred != 'empty':
+                # Nullable string dtype keeps nulls as NA without a 'nan' round trip
+                df_prepared[col] = values.astype('string')
         
         return df_prepared
     
@@ -338,33 +895,88 @@ class DataWarehouseLoader:
             self.logger.error(f"SQL execution failed: {str(e)}")
             raise
     
+    @staticmethod
+    def _is_select(sql: str) -> bool:
+        """Check whether a statement is a SELECT, uppercasing only its first word."""
+        return sql.lstrip()[:6].upper() == 'SELECT'
+    
+    def _table_sql(self, statement: str, table_name: str) -> str:
+        """Get a per-table SQL statement, rendering it once per table."""
+        key = (statement, table_name)
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            sql = _SQL_TEMPLATES[statement].format(
+                table=f"{self._schema_prefix}{table_name}",
+                name=table_name.replace("'", "''")
+            )
+            self._sql_cache[key] = sql
+        return sql
+    
     def _execute_redshift_sql(self, sql: str, params: Optional[Dict]) -> Optional[pd.DataFrame]:
         """Execute SQL on Redshift."""
-        with self.engine.connect() as conn:
-            if sql.strip().upper().startswith('SELECT'):
-                # Return results for SELECT queries
-                return pd.read_sql(sql, conn, params=params)
-            else:
-                # Execute non-SELECT queries
-                conn.execute(sqlalchemy.text(sql), params or {})
-                conn.commit()
-                return None
+        if self._is_select(sql):
+            # Return results for SELECT queries
+            return self._fetch_redshift_frame(sql, params)
+        
+        # Execute non-SELECT queries in a transaction committed on exit
+        with self.engine.begin() as conn:
+            conn.execute(sqlalchemy.text(sql), params or {})
+        return None
+    
+    def _fetch_redshift_frame(self, sql: str, params: Optional[Dict]) -> pd.DataFrame:
+        """
+        Run a SELECT and materialize the result through Arrow record batches.
+        
+        Rows are fetched _FETCH_ROWS at a time and converted column-wise by
+        Arrow, so columns get native dtypes instead of object columns that
+        pandas has to re-infer.
+        """
+        conn = self.engine.raw_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                columns = [desc[0] for desc in cursor.description]
+                
+                tables = []
+                while True:
+                    rows = cursor.fetchmany(_FETCH_ROWS)
+                    if not rows:
+                        break
+                    arrays = [pa.array(values) for values in zip(*rows)]
+                    tables.append(pa.Table.from_arrays(arrays, names=columns))
+        finally:
+            conn.close()
+        
+        if not tables:
+            return pd.DataFrame(columns=columns)
+        
+        # Columns that were all-null in one batch are promoted to the type seen in others
+        table = pa.concat_tables(tables, promote_options='permissive')
+        return table.to_pandas(self_destruct=True, split_blocks=True)
     
     def _execute_bigquery_sql(self, sql: str, params: Optional[Dict]) -> Optional[pd.DataFrame]:
         """Execute SQL on BigQuery."""
         job_config = bigquery.QueryJobConfig()
         
         if params:
-            # Convert parameters to BigQuery format
+            # Convert parameters to BigQuery format, keeping their native types
             query_parameters = []
             for key, value in params.items():
-                param = bigquery.ScalarQueryParameter(key, "STRING", str(value))
+                if isinstance(value, (list, tuple)):
+                    element_type = _BQ_PARAM_TYPES.get(type(value[0]), 'STRING') if value else 'STRING'
+                    param = bigquery.ArrayQueryParameter(key, element_type, list(value))
+                elif type(value) in _BQ_PARAM_TYPES or value is None:
+                    param = bigquery.ScalarQueryParameter(
+                        key, _BQ_PARAM_TYPES.get(type(value), 'STRING'), value
+                    )
+                else:
+                    param = bigquery.ScalarQueryParameter(key, 'STRING', str(value))
                 query_parameters.append(param)
             job_config.query_parameters = query_parameters
         
         query_job = self.bq_client.query(sql, job_config=job_config)
         
-        if sql.strip().upper().startswith('SELECT'):
+        if self._is_select(sql):
             # Return results for SELECT queries
             return query_job.to_dataframe()
         else:
@@ -387,20 +999,30 @@ class DataWarehouseLoader:
         """
         results = {}
         
+        loads = []
         for data_name, df in data.items():
-            if df.empty:
+            if df.shape[0] == 0:
                 self.logger.warning(f"Skipping empty DataFrame: {data_name}")
                 continue
+            loads.append((data_name, table_prefix + data_name, df))
+        
+        # Loads are I/O-bound, so tables are loaded concurrently; the Redshift
+        # connection pool is sized to at least _MAX_LOAD_WORKERS
+        max_workers = max(1, min(_MAX_LOAD_WORKERS, len(loads)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.load_dataframe, df, table_name, if_exists): (data_name, table_name)
+                for data_name, table_name, df in loads
+            }
             
-            table_name = f"{table_prefix}{data_name}" if table_prefix else data_name
-            
-            try:
-                success = self.load_dataframe(df, table_name, if_exists)
-                results[table_name] = success
-                
-            except Exception as e:
-                self.logger.error(f"Failed to load {data_name} to {table_name}: {str(e)}")
-                results[table_name] = False
+            for future in as_completed(futures):
+                data_name, table_name = futures[future]
+                try:
+                    results[table_name] = future.result()
+                    
+                except Exception as e:
+                    self.logger.error(f"Failed to load {data_name} to {table_name}: {str(e)}")
+                    results[table_name] = False
         
         successful_loads = sum(1 for success in results.values() if success)
         self.logger.info(f"Successfully loaded {successful_loads}/{len(results)} tables")
@@ -418,47 +1040,114 @@ class DataWarehouseLoader:
         Returns:
             Validation results
         """
-        try:
-            self.logger.info(f"Validating data load for table: {table_name}")
+        self.logger.info(f"Validating data load for table: {table_name}")
+        return self.validate_multiple_loads({table_name: expected_count})[table_name]
+    
+    def validate_multiple_loads(self, expected_counts: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate several data loads, reading all record counts in one round trip.
+        
+        Args:
+            expected_counts: Dictionary mapping table names to expected record counts
             
-            # Get table statistics
+        Returns:
+            Dictionary mapping table names to validation results
+        """
+        validation_timestamp = datetime.now(timezone.utc).isoformat()
+        
+        try:
+            # Get table statistics from metadata rather than full-table scans
             if self.provider == 'redshift':
-                count_sql = f"SELECT COUNT(*) as record_count FROM {self.schema}.{table_name}"
+                actual_counts = self._count_redshift_rows(list(expected_counts), expected_counts)
             else:  # BigQuery
-                count_sql = f"SELECT COUNT(*) as record_count FROM `{self.dataset_id}.{table_name}`"
-            
-            result_df = self.execute_sql(count_sql)
-            actual_count = result_df['record_count'].iloc[0] if not result_df.empty else 0
-            
-            validation_result = {
-                'table_name': table_name,
-                'expected_count': expected_count,
-                'actual_count': actual_count,
-                'count_match': actual_count == expected_count,
-                'validation_timestamp': datetime.now().isoformat(),
-                'is_valid': True,
-                'errors': []
+                actual_counts = {
+                    table_name: self._count_bigquery_rows(table_name)
+                    for table_name in expected_counts
+                }
+                
+        except Exception as e:
+            self.logger.error(f"Validation failed for {', '.join(expected_counts)}: {str(e)}")
+            return {
+                table_name: {
+                    'table_name': table_name,
+                    'is_valid': False,
+                    'errors': [f"Validation error: {str(e)}"],
+                    'validation_timestamp': validation_timestamp
+                }
+                for table_name in expected_counts
             }
+        
+        results = {}
+        for table_name, expected_count in expected_counts.items():
+            actual_count = actual_counts[table_name]
+            count_match = actual_count == expected_count
             
             # Check if counts match
-            if actual_count != expected_count:
-                validation_result['is_valid'] = False
-                validation_result['errors'].append(
-                    f"Record count mismatch: expected {expected_count}, got {actual_count}"
-                )
+            errors = [] if count_match else [
+                f"Record count mismatch: expected {expected_count}, got {actual_count}"
+            ]
             
             # Additional validations can be added here
             
-            return validation_result
-            
-        except Exception as e:
-            self.logger.error(f"Validation failed for {table_name}: {str(e)}")
-            return {
+            results[table_name] = {
                 'table_name': table_name,
-                'is_valid': False,
-                'errors': [f"Validation error: {str(e)}"],
-                'validation_timestamp': datetime.now().isoformat()
+                'expected_count': expected_count,
+                'actual_count': actual_count,
+                'count_match': count_match,
+                'validation_timestamp': validation_timestamp,
+                'is_valid': count_match,
+                'errors': errors
             }
+        
+        return results
+    
+    def _count_redshift_rows(self, table_names: List[str],
+                             expected_counts: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """
+        Count rows of several tables in at most two queries.
+        
+        Counts come from svv_table_info catalog stats. Tables without stats
+        (empty tables, or Postgres endpoints without the view) are counted
+        together in one UNION ALL of COUNT(*) queries.
+        
+        tbl_rows includes rows marked for deletion but not yet vacuumed and
+        can lag behind recent loads, so with expected_counts it only serves
+        as a fast pre-check: tables whose stats disagree are recounted exactly.
+        """
+        counts = {}
+        try:
+            stats_sql = sqlalchemy.text(
+                'SELECT "table", tbl_rows FROM svv_table_info '
+                'WHERE "schema" = :schema AND "table" IN :tables'
+            ).bindparams(sqlalchemy.bindparam('tables', expanding=True))
+            
+            with self.engine.connect() as conn:
+                rows = conn.execute(stats_sql, {'schema': self.schema, 'tables': table_names})
+                counts = {table: int(tbl_rows) for table, tbl_rows in rows}
+        except sqlalchemy.exc.DBAPIError:
+            # svv_table_info only exists on Redshift
+            pass
+        
+        missing = [
+            table_name for table_name in table_names
+            if table_name not in counts
+            or (expected_counts is not None and counts[table_name] != expected_counts.get(table_name))
+        ]
+        if missing:
+            union_sql = ' UNION ALL '.join(self._table_sql('count', table_name) for table_name in missing)
+            with self.engine.connect() as conn:
+                rows = conn.execute(sqlalchemy.text(union_sql))
+                counts.update({table: int(record_count) for table, record_count in rows})
+        
+        return counts
+    
+    def _count_bigquery_rows(self, table_name: str) -> int:
+        """Count table rows from table metadata, including rows still in the streaming buffer."""
+        table = self._get_bigquery_table(table_name)
+        count = table.num_rows or 0
+        if table.streaming_buffer is not None:
+            count += table.streaming_buffer.estimated_rows or 0
+        return count
     
     def get_table_info(self, table_name: str) -> Dict[str, Any]:
         """
@@ -481,28 +1170,47 @@ class DataWarehouseLoader:
             return {'error': str(e)}
     
     def _get_redshift_table_info(self, table_name: str) -> Dict[str, Any]:
-        """Get Redshift table information."""
-        info_sql = f"""
-        SELECT 
-            COUNT(*) as record_count,
-            MAX(pg_total_relation_size('{self.schema}.{table_name}')) as size_bytes
-        FROM {self.schema}.{table_name}
         """
+        Get Redshift table information from catalog stats.
         
-        result_df = self.execute_sql(info_sql)
+        svv_table_info reports the size in 1MB blocks. Empty tables, and
+        Postgres endpoints without the view, fall back to COUNT(*) and
+        pg_total_relation_size.
+        """
+        info_sql = sqlalchemy.text(
+            'SELECT tbl_rows, size FROM svv_table_info WHERE "schema" = :schema AND "table" = :table'
+        )
+        
+        row = None
+        try:
+            with self.engine.connect() as conn:
+                row = conn.execute(info_sql, {'schema': self.schema, 'table': table_name}).first()
+        except sqlalchemy.exc.DBAPIError:
+            # svv_table_info only exists on Redshift
+            pass
+        
+        if row is not None:
+            record_count = int(row.tbl_rows)
+            size_bytes = int(row.size) * 1024 * 1024
+        else:
+            record_count = self._count_redshift_rows([table_name])[table_name]
+            with self.engine.connect() as conn:
+                size_bytes = conn.execute(
+                    sqlalchemy.text("SELECT pg_total_relation_size(:relation)"),
+                    {'relation': f"{self._schema_prefix}{table_name}"}
+                ).scalar()
         
         return {
             'table_name': table_name,
             'provider': 'redshift',
-            'record_count': result_df['record_count'].iloc[0],
-            'size_bytes': result_df['size_bytes'].iloc[0],
+            'record_count': record_count,
+            'size_bytes': size_bytes,
             'schema': self.schema
         }
     
     def _get_bigquery_table_info(self, table_name: str) -> Dict[str, Any]:
         """Get BigQuery table information."""
-        table_ref = self.bq_client.dataset(self.dataset_id).table(table_name)
-        table = self.bq_client.get_table(table_ref)
+        table = self._get_bigquery_table(table_name)
         
         return {
             'table_name': table_name,
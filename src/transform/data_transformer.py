@@ -4,19 +4,227 @@ Data transformation and cleaning for COVID-19 ETL Pipeline.
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
 
 from .data_validator import DataValidator
 from ..utils.config import config
 from ..utils.logger import get_logger
 
 
+# Common country name variations and their standard names (read-only)
+_COUNTRY_MAPPINGS = MappingProxyType({
+    'US': 'United States',
+    'USA': 'United States',
+    'United States of America': 'United States',
+    'UK': 'United Kingdom',
+    'Britain': 'United Kingdom',
+    'Great Britain': 'United Kingdom',
+    'South Korea': 'Korea, South',
+    'North Korea': 'Korea, North',
+    'Russia': 'Russian Federation',
+    'Iran': 'Iran, Islamic Republic of',
+    'Syria': 'Syrian Arab Republic',
+    'Venezuela': 'Venezuela, Bolivarian Republic of',
+    'Bolivia': 'Bolivia, Plurinational State of',
+    'Tanzania': 'Tanzania, United Republic of',
+    'Moldova': 'Moldova, Republic of',
+    'Macedonia': 'North Macedonia',
+    'Czech Republic': 'Czechia',
+    'Myanmar': 'Myanmar',
+    'Burma': 'Myanmar',
+    'Congo (Kinshasa)': 'Congo, Democratic Republic of the',
+    'Congo (Brazzaville)': 'Congo',
+    'Ivory Coast': "Cote d'Ivoire",
+})
+
+# Placeholder country names dropped during cleaning (compared lowercased)
+_INVALID_COUNTRIES = frozenset({'', 'null', 'undefined', 'n/a'})
+
+# Column-name patterns used to classify columns by role
+_TS_RE = re.compile(r'updated|date', re.IGNORECASE)
+_NUM_RE = re.compile(r'cases|deaths|recovered|tests|population|active|critical|today', re.IGNORECASE)
+_COUNT_RE = re.compile(r'cases|deaths|recovered|tests|population', re.IGNORECASE)
+_RATE_RE = re.compile(r'rate|per|ratio|percentage', re.IGNORECASE)
+_GEO_RE = re.compile(r'country|continent', re.IGNORECASE)
+
+# Repeated string columns stored as categoricals so Parquet dictionary-encodes them
+_DICTIONARY_COLUMNS = ('country', 'continent', 'region_type', 'metric')
+
+# Parquet writer settings for processed datasets
+_PARQUET_OPTIONS = {
+    'engine': 'pyarrow',
+    'compression': 'zstd',
+    'compression_level': 3,
+    'use_dictionary': True,
+    'data_page_size': 1 << 20,
+    'write_statistics': True,
+}
+
+# Natural log of 2, the numerator of the doubling-time formula
+_LN2 = 0.6931471805599453
+
+# Window, in rows, of the historical rolling averages
+_ROLLING_WINDOW = 7
+
+# Value range of int32, the fixed width for integer count columns
+_INT32_INFO = np.iinfo(np.int32)
+
+
+def _iso_week(days: np.ndarray) -> pd.arrays.IntegerArray:
+    """
+    Compute ISO-8601 week numbers directly from datetime64[D] values.
+    
+    Args:
+        days: Dates as datetime64[D]
+        
+    Returns:
+        Nullable UInt32 week numbers (missing where the date is NaT)
+    """
+    # 1970-01-01 was a Thursday, so Monday-based weekday is (epoch days + 3) % 7
+    weekday = (days.view(np.int64) + 3) % 7
+    
+    # The ISO year of a date is the calendar year of its week's Thursday
+    thursday = days - weekday.astype('timedelta64[D]') + np.timedelta64(3, 'D')
+    year_start = thursday.astype('datetime64[Y]').astype('datetime64[D]')
+    week = (thursday - year_start).astype(np.int64) // 7 + 1
+    
+    missing = np.isnat(days)
+    return pd.arrays.IntegerArray(np.where(missing, 0, week).astype(np.uint32), missing)
+
+
+def _count_dtype(values: pd.Series) -> Any:
+    """Return int32 when every count fits in it, else int64 (nullable if needed)."""
+    fits = values.count() == 0 or (values.min() >= _INT32_INFO.min and values.max() <= _INT32_INFO.max)
+    if isinstance(values.dtype, pd.api.extensions.ExtensionDtype):
+        return pd.Int32Dtype() if fits else pd.Int64Dtype()
+    return np.int32 if fits else np.int64
+
+
+def _group_shift(values: np.ndarray, group_ids: np.ndarray, periods: int) -> np.ndarray:
+    """
+    Shift sorted values by a number of rows without crossing group boundaries.
+    
+    Args:
+        values: Values sorted so that each group is a contiguous run
+        group_ids: Group id of each row (negative for rows in no group)
+        periods: Number of rows to shift forward
+        
+    Returns:
+        Shifted values, NaN where the source row is in another group
+    """
+    shifted = np.full(len(values), np.nan)
+    if periods < len(values):
+        shifted[periods:] = values[:-periods]
+        crossed = group_ids[periods:] != group_ids[:-periods]
+        shifted[periods:][crossed | (group_ids[periods:] < 0)] = np.nan
+    return shifted
+
+
+def _group_ffill(values: np.ndarray, group_ids: np.ndarray) -> np.ndarray:
+    """
+    Forward-fill NaNs in sorted values without crossing group boundaries.
+    
+    Matches the padding pandas pct_change applies before computing changes.
+    
+    Args:
+        values: Values sorted so that each group is a contiguous run
+        group_ids: Group id of each row
+        
+    Returns:
+        Filled values, NaN where no earlier value exists in the same group
+    """
+    # Index of the last non-NaN row at or before each row
+    source = np.where(np.isnan(values), 0, np.arange(len(values)))
+    np.maximum.accumulate(source, out=source)
+    
+    filled = values[source]
+    filled[group_ids[source] != group_ids] = np.nan
+    return filled
+
+
+def _segmented_rolling_means(values: np.ndarray, starts: np.ndarray,
+                             window: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute per-group differences and trailing rolling means in one pass.
+    
+    Args:
+        values: Values sorted so that each group is a contiguous run
+        starts: Offsets of each group's first row, followed by len(values)
+        window: Rolling window size in rows
+        
+    Returns:
+        Tuple of (diff, rolling mean of values, rolling mean of diff); the
+        means skip NaNs and need only one observation (min_periods=1)
+    """
+    n = values.shape[0]
+    change = np.full(n, np.nan)
+    value_avg = np.full(n, np.nan)
+    change_avg = np.full(n, np.nan)
+    
+    for g in prange(starts.shape[0] - 1):
+        lo = starts[g]
+        hi = starts[g + 1]
+        value_sum = 0.0
+        value_count = 0
+        change_sum = 0.0
+        change_count = 0
+        
+        for i in range(lo, hi):
+            if i > lo:
+                change[i] = values[i] - values[i - 1]
+            
+            if not np.isnan(values[i]):
+                value_sum += values[i]
+                value_count += 1
+            if not np.isnan(change[i]):
+                change_sum += change[i]
+                change_count += 1
+            
+            # Drop the observation leaving the window
+            j = i - window
+            if j >= lo:
+                if not np.isnan(values[j]):
+                    value_sum -= values[j]
+                    value_count -= 1
+                if not np.isnan(change[j]):
+                    change_sum -= change[j]
+                    change_count -= 1
+            
+            if value_count > 0:
+                value_avg[i] = value_sum / value_count
+            else:
+                value_sum = 0.0
+            if change_count > 0:
+                change_avg[i] = change_sum / change_count
+            else:
+                change_sum = 0.0
+    
+    return change, value_avg, change_avg
+
+
+if njit is not None:
+    _segmented_rolling_means = njit(parallel=True, cache=True)(_segmented_rolling_means)
+
+
 class CovidDataTransformer:
     """Main class for transforming and cleaning COVID-19 data."""
     
+    # Runs of characters that are not allowed in column names
+    _NON_ALNUM = re.compile(r'[^a-zA-Z0-9]+')
+    
     def __init__(self):
         """Initialize transformer."""
         self.logger = get_logger(__name__)
@@ -24,7 +232,10 @@ class CovidDataTransformer:
         self.storage_config = config.get_storage_config()
         
         # Country code mappings for standardization
-        self.country_mappings = self._load_country_mappings()
+        self.country_mappings = _COUNTRY_MAPPINGS
+        
+        # Wall-clock snapshot shared by every dataset in a pipeline run
+        self._pipeline_now: Optional[np.datetime64] = None
     
     def transform_all_data(self, raw_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
         """
@@ -39,6 +250,7 @@ class CovidDataTransformer:
         self.logger.info("Starting data transformation for all datasets")
         
         transformed_data = {}
+        self._pipeline_now = np.datetime64(datetime.now(), 'ns')
         
         try:
             for data_type, df in raw_data.items():
@@ -82,8 +294,6 @@ class CovidDataTransformer:
     
     def _apply_common_transformations(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
         """Apply common transformations to all datasets."""
-        df = df.copy()
-        
         # Standardize column names
         df = self._standardize_column_names(df)
         
@@ -103,118 +313,148 @@ class CovidDataTransformer:
     
     def _standardize_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize column names."""
-        df = df.copy()
+        # Shallow copy: relabelling must not rename the caller's columns
+        df = df.copy(deep=False)
         
-        # Convert to lowercase and replace spaces/special chars with underscores
-        df.columns = df.columns.str.lower().str.replace(r'[^a-zA-Z0-9]', '_', regex=True)
-        
-        # Remove multiple consecutive underscores
-        df.columns = df.columns.str.replace(r'_+', '_', regex=True)
-        
-        # Remove leading/trailing underscores
-        df.columns = df.columns.str.strip('_')
+        # Lowercase, collapse runs of special chars into one underscore and
+        # trim leading/trailing underscores in a single pass
+        df.columns = [self._NON_ALNUM.sub('_', str(col).lower()).strip('_')
+                      for col in df.columns]
         
         return df
     
     def _handle_missing_values(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
         """Handle missing values based on data type and column characteristics."""
-        df = df.copy()
-        
-        # Numeric columns: fill with 0 for count-based metrics
         numeric_cols = df.select_dtypes(include=[np.number]).columns
-        count_columns = [col for col in numeric_cols if any(keyword in col.lower() 
-                        for keyword in ['cases', 'deaths', 'recovered', 'tests', 'population'])]
-        
-        for col in count_columns:
-            df[col] = df[col].fillna(0)
-        
-        # Rate/percentage columns: fill with median or 0
-        rate_columns = [col for col in numeric_cols if any(keyword in col.lower() 
-                       for keyword in ['rate', 'per', 'ratio', 'percentage'])]
-        
-        for col in rate_columns:
-            if col in df.columns:
-                df[col] = df[col].fillna(df[col].median())
-        
-        # String columns: fill with 'Unknown' or appropriate default
-        string_cols = df.select_dtypes(include=['object']).columns
-        for col in string_cols:
-            if 'country' in col.lower():
-                df[col] = df[col].fillna('Unknown')
-            elif 'continent' in col.lower():
-                df[col] = df[col].fillna('Unknown')
-            else:
-                df[col] = df[col].fillna('N/A')
+        # 'string' also matches Arrow-backed strings from an earlier transform
+        string_cols = df.select_dtypes(include=['object', 'string']).columns
+        
+        # Classify columns once with vectorized keyword masks
+        count_columns = numeric_cols[numeric_cols.str.contains(_COUNT_RE)]
+        rate_columns = numeric_cols[numeric_cols.str.contains(_RATE_RE)]
+        
+        # Rate/percentage columns: fill with median
+        fill_map = df[rate_columns].median().to_dict() if len(rate_columns) else {}
+        
+        # Count-based metrics: fill with 0 (takes precedence over rate medians)
+        fill_map.update(dict.fromkeys(count_columns, 0))
+        
+        # String columns: 'Unknown' for geography, 'N/A' otherwise
+        geo_mask = string_cols.str.contains(_GEO_RE)
+        fill_map.update(dict.fromkeys(string_cols[geo_mask], 'Unknown'))
+        fill_map.update(dict.fromkeys(string_cols[~geo_mask], 'N/A'))
+        
+        # One fillna call instead of a dispatch per column; not in place, so
+        # the caller's frame is left untouched
+        if fill_map:
+            df = df.fillna(value=fill_map)
         
         return df
     
     def _convert_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Convert columns to appropriate data types."""
-        df = df.copy()
+        # Shallow copy: columns are replaced below, never written in place
+        df = df.copy(deep=False)
         
         # Convert timestamp columns
-        timestamp_cols = [col for col in df.columns if 'updated' in col.lower() or 'date' in col.lower()]
+        columns = df.columns.astype(str)
+        timestamp_cols = df.columns[columns.str.contains(_TS_RE)]
         for col in timestamp_cols:
-            if col in df.columns:
-                try:
-                    if df[col].dtype == 'object':
-                        df[col] = pd.to_datetime(df[col], errors='coerce')
-                    elif pd.api.types.is_numeric_dtype(df[col]):
-                        # Assume Unix timestamp in milliseconds
-                        df[col] = pd.to_datetime(df[col], unit='ms', errors='coerce')
-                except Exception as e:
-                    self.logger.warning(f"Could not convert {col} to datetime: {str(e)}")
+            try:
+                if df[col].dtype == 'object':
+                    df[col] = pd.to_datetime(df[col], errors='coerce')
+                elif pd.api.types.is_numeric_dtype(df[col]):
+                    # Assume Unix timestamp in milliseconds
+                    df[col] = pd.to_datetime(df[col], unit='ms', errors='coerce')
+            except Exception as e:
+                self.logger.warning(f"Could not convert {col} to datetime: {str(e)}")
         
         # Convert numeric columns
-        numeric_candidates = [col for col in df.columns if any(keyword in col.lower() 
-                             for keyword in ['cases', 'deaths', 'recovered', 'tests', 'population', 
-                                           'active', 'critical', 'today'])]
+        numeric_candidates = df.columns[columns.str.contains(_NUM_RE)]
+        rate_candidates = set(df.columns[columns.str.contains(_RATE_RE)])
         
         for col in numeric_candidates:
-            if col in df.columns and df[col].dtype == 'object':
-                try:
+            try:
+                if df[col].dtype == 'object':
                     df[col] = pd.to_numeric(df[col], errors='coerce')
-                except Exception as e:
-                    self.logger.warning(f"Could not convert {col} to numeric: {str(e)}")
+                
+                # Rates tolerate float32. Integer counts get a fixed width
+                # (int32, or int64 when the values do not fit) so every day's
+                # output, and any warehouse table created from it, shares one schema
+                if pd.api.types.is_bool_dtype(df[col]):
+                    continue
+                if col in rate_candidates:
+                    if pd.api.types.is_numeric_dtype(df[col]):
+                        df[col] = pd.to_numeric(df[col], downcast='float')
+                elif pd.api.types.is_integer_dtype(df[col]):
+                    df[col] = df[col].astype(_count_dtype(df[col]))
+            except Exception as e:
+                self.logger.warning(f"Could not convert {col} to numeric: {str(e)}")
+        
+        # Move pure-string object columns onto Arrow so string kernels run in C++
+        arrow_string = pd.ArrowDtype(pa.string())
+        string_cols = [col for col in df.select_dtypes(include=['object']).columns
+                       if pd.api.types.infer_dtype(df[col], skipna=True) == 'string']
+        if string_cols:
+            df = df.astype(dict.fromkeys(string_cols, arrow_string))
         
         return df
     
     def _add_derived_columns(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
         """Add derived columns for analysis."""
-        df = df.copy()
-        
-        # Add processing metadata
-        df['processed_at'] = datetime.now()
-        df['data_freshness_hours'] = None
+        # Add processing metadata as a typed datetime64 scalar
+        now = self._pipeline_now
+        if now is None:
+            now = np.datetime64(datetime.now(), 'ns')
+        derived = {'processed_at': now}
         
+        # Freshness in hours, computed on int64 nanoseconds (3.6e12 ns per hour)
         if 'updated' in df.columns:
-            df['data_freshness_hours'] = (datetime.now() - df['updated']).dt.total_seconds() / 3600
+            updated_ns = df['updated'].to_numpy(dtype='datetime64[ns]')
+            age_ns = (now - updated_ns).astype(np.int64)
+            derived['data_freshness_hours'] = np.where(np.isnat(updated_ns), np.nan, age_ns / 3.6e12)
+        else:
+            derived['data_freshness_hours'] = np.nan
         
         # Add calculated metrics for case data
         if data_type in ['global', 'countries', 'continents', 'states']:
-            # Mortality rate
-            if all(col in df.columns for col in ['deaths', 'cases']):
-                df['mortality_rate'] = np.where(df['cases'] > 0, df['deaths'] / df['cases'], 0)
+            def column(name: str) -> Optional[np.ndarray]:
+                if name not in df.columns:
+                    return None
+                return df[name].to_numpy(dtype=np.float64, copy=False)
             
-            # Recovery rate
-            if all(col in df.columns for col in ['recovered', 'cases']):
-                df['recovery_rate'] = np.where(df['cases'] > 0, df['recovered'] / df['cases'], 0)
+            def scaled(values: np.ndarray, inverse: np.ndarray, mask: np.ndarray) -> np.ndarray:
+                return np.multiply(values, inverse, out=np.zeros_like(inverse), where=mask)
             
-            # Active case rate
-            if all(col in df.columns for col in ['active', 'cases']):
-                df['active_rate'] = np.where(df['cases'] > 0, df['active'] / df['cases'], 0)
-            
-            # Cases per million (if population data available)
-            if all(col in df.columns for col in ['cases', 'population']):
-                df['cases_per_million'] = np.where(df['population'] > 0, 
-                                                 (df['cases'] / df['population']) * 1000000, 0)
+            # Mortality, recovery and active rates share one reciprocal of cases
+            cases = column('cases')
+            if cases is not None:
+                case_mask = cases > 0
+                inv_cases = np.zeros_like(cases)
+                np.divide(1.0, cases, out=inv_cases, where=case_mask)
+                
+                for source, target in (('deaths', 'mortality_rate'),
+                                       ('recovered', 'recovery_rate'),
+                                       ('active', 'active_rate')):
+                    values = column(source)
+                    if values is not None:
+                        derived[target] = scaled(values, inv_cases, case_mask)
             
-            # Deaths per million
-            if all(col in df.columns for col in ['deaths', 'population']):
-                df['deaths_per_million'] = np.where(df['population'] > 0, 
-                                                  (df['deaths'] / df['population']) * 1000000, 0)
-        
-        return df
+            # Per-million metrics share one scaled reciprocal of population
+            population = column('population')
+            if population is not None:
+                pop_mask = population > 0
+                inv_pop = np.zeros_like(population)
+                np.divide(1e6, population, out=inv_pop, where=pop_mask)
+                
+                for source, target in (('cases', 'cases_per_million'),
+                                       ('deaths', 'deaths_per_million')):
+                    values = column(source)
+                    if values is not None:
+                        derived[target] = scaled(values, inv_pop, pop_mask)
+        
+        # Attach every derived column in one insertion
+        return df.assign(**derived)
     
     def _remove_duplicates(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
         """Remove duplicate records."""
@@ -224,8 +464,10 @@ class CovidDataTransformer:
             # Remove duplicates based on country name
             df = df.drop_duplicates(subset=['country'], keep='last')
         elif data_type == 'historical':
-            # Remove duplicates based on date, country, and metric
-            df = df.drop_duplicates(subset=['date', 'country', 'metric'], keep='last')
+            # Keep the last record per date, country and metric; rows stay in
+            # their original order and missing keys form their own group
+            df = df.groupby(['date', 'country', 'metric'], sort=False, observed=True,
+                            dropna=False).tail(1)
         else:
             # General duplicate removal
             df = df.drop_duplicates(keep='last')
@@ -238,33 +480,28 @@ class CovidDataTransformer:
     
     def transform_global_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform global COVID-19 data."""
-        df = df.copy()
-        
         # Add global identifier
-        df['region_type'] = 'global'
-        df['region_name'] = 'World'
+        new_cols = {'region_type': 'global', 'region_name': 'World'}
         
         # Ensure required columns exist
         required_columns = ['cases', 'deaths', 'recovered', 'active']
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = 0
+        new_cols.update({col: 0 for col in required_columns if col not in df.columns})
         
-        return df
+        return df.assign(**new_cols)
     
     def transform_countries_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform countries COVID-19 data."""
-        df = df.copy()
-        
         # Standardize country names
         df = self._standardize_country_names(df)
         
         # Add region type
-        df['region_type'] = 'country'
+        new_cols = {'region_type': 'country'}
         
         # Extract and clean country info
         if 'country' in df.columns:
-            df['region_name'] = df['country']
+            new_cols['region_name'] = df['country']
+        
+        df = df.assign(**new_cols)
         
         # Handle country-specific data cleaning
         df = self._clean_country_specific_data(df)
@@ -273,153 +510,173 @@ class CovidDataTransformer:
     
     def transform_continents_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform continents COVID-19 data."""
-        df = df.copy()
-        
         # Add region type
-        df['region_type'] = 'continent'
+        new_cols = {'region_type': 'continent'}
         
         if 'continent' in df.columns:
-            df['region_name'] = df['continent']
+            new_cols['region_name'] = df['continent']
         
-        return df
+        return df.assign(**new_cols)
     
     def transform_states_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform US states COVID-19 data."""
-        df = df.copy()
-        
         # Add region type
-        df['region_type'] = 'state'
-        df['country'] = 'USA'
+        new_cols = {'region_type': 'state', 'country': 'USA'}
         
         if 'state' in df.columns:
-            df['region_name'] = df['state']
+            new_cols['region_name'] = df['state']
         
-        return df
+        return df.assign(**new_cols)
     
     def transform_vaccine_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform vaccine data."""
-        df = df.copy()
-        
         # Add data type identifier
-        df['data_category'] = 'vaccination'
-        
-        return df
+        return df.assign(data_category='vaccination')
     
     def transform_historical_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform historical COVID-19 data."""
-        df = df.copy()
-        
         # Ensure date column is properly formatted
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
+            dates = pd.DatetimeIndex(pd.to_datetime(df['date']))
             
-            # Add time-based features
-            df['year'] = df['date'].dt.year
-            df['month'] = df['date'].dt.month
-            df['day_of_week'] = df['date'].dt.dayofweek
-            df['week_of_year'] = df['date'].dt.isocalendar().week
+            # Add time-based features from one DatetimeIndex in one insertion
+            df = df.assign(date=dates,
+                           year=dates.year,
+                           month=dates.month,
+                           day_of_week=dates.dayofweek,
+                           week_of_year=_iso_week(dates.values.astype('datetime64[D]')))
         
         # Calculate daily changes if we have time series data
         if all(col in df.columns for col in ['date', 'country', 'metric', 'value']):
             df = df.sort_values(['country', 'metric', 'date'])
-            df['daily_change'] = df.groupby(['country', 'metric'])['value'].diff()
-            df['daily_change_pct'] = df.groupby(['country', 'metric'])['value'].pct_change()
+            group_ids = df.groupby(['country', 'metric'], sort=False, observed=True).ngroup().to_numpy()
+            values = df['value'].to_numpy(dtype=np.float64)
             
-            # Calculate rolling averages
-            df['value_7day_avg'] = df.groupby(['country', 'metric'])['value'].rolling(
-                window=7, min_periods=1).mean().reset_index(0, drop=True)
+            # Previous value within each group, used by the daily change
+            previous = _group_shift(values, group_ids, 1)
             
-            df['daily_change_7day_avg'] = df.groupby(['country', 'metric'])['daily_change'].rolling(
-                window=7, min_periods=1).mean().reset_index(0, drop=True)
+            # Percent change pads gaps first, as pandas pct_change does
+            filled = _group_ffill(values, group_ids)
+            filled_previous = _group_shift(filled, group_ids, 1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                df['daily_change_pct'] = (filled - filled_previous) / filled_previous
+            
+            # Calculate daily changes and rolling averages
+            if njit is not None:
+                df = self._add_rolling_metrics(df, values, group_ids)
+            else:
+                df['daily_change'] = values - previous
+                grouped = df.groupby(['country', 'metric'], sort=False, observed=True)
+                
+                df['value_7day_avg'] = grouped['value'].rolling(
+                    window=_ROLLING_WINDOW, min_periods=1).mean().reset_index(level=[0, 1], drop=True)
+                
+                df['daily_change_7day_avg'] = grouped['daily_change'].rolling(
+                    window=_ROLLING_WINDOW, min_periods=1).mean().reset_index(level=[0, 1], drop=True)
         
         return df
     
+    def _add_rolling_metrics(self, df: pd.DataFrame, values: np.ndarray,
+                             group_ids: np.ndarray) -> pd.DataFrame:
+        """
+        Add daily changes and 7-day averages with the jitted segmented kernel.
+        
+        Args:
+            df: Historical data sorted by country, metric and date
+            values: The value column as float64
+            group_ids: Country/metric group id of each row
+            
+        Returns:
+            DataFrame with daily_change, value_7day_avg and daily_change_7day_avg
+        """
+        # Sorted groups are contiguous, so group starts are where the id changes
+        boundaries = np.flatnonzero(group_ids[1:] != group_ids[:-1]) + 1
+        starts = np.concatenate(([0], boundaries, [len(values)])).astype(np.int64)
+        
+        change, value_avg, change_avg = _segmented_rolling_means(values, starts, _ROLLING_WINDOW)
+        
+        # Rows with a missing country or metric belong to no group
+        ungrouped = group_ids < 0
+        if ungrouped.any():
+            for result in (change, value_avg, change_avg):
+                result[ungrouped] = np.nan
+        
+        return df.assign(daily_change=change,
+                         value_7day_avg=value_avg,
+                         daily_change_7day_avg=change_avg)
+    
     def _standardize_country_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize country names using mappings."""
         if 'country' not in df.columns:
             return df
         
-        df = df.copy()
-        
-        # Apply country name mappings
-        df['country'] = df['country'].replace(self.country_mappings)
-        
-        # Clean country names
-        df['country'] = df['country'].str.strip()
-        df['country'] = df['country'].str.title()
-        
-        return df
+        # Map and clean each distinct name once, then rebuild the column as a
+        # categorical from the factorized codes (O(unique) string work)
+        codes, uniques = pd.factorize(df['country'])
+        mapped = [self.country_mappings.get(name, name) for name in uniques]
+        cleaned = pd.Index([name.strip().title() if isinstance(name, str) else np.nan
+                            for name in mapped])
+        categories = cleaned.dropna().unique()
+        
+        # Trailing -1 keeps missing values (code -1) missing after the lookup
+        lookup = np.append(categories.get_indexer(cleaned), -1)
+        return df.assign(country=pd.Categorical.from_codes(lookup[codes], categories=categories))
     
     def _clean_country_specific_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean country-specific data issues."""
-        df = df.copy()
-        
         # Handle specific data quality issues
         # Remove countries with invalid data
         if 'country' in df.columns:
-            invalid_countries = ['', 'null', 'undefined', 'N/A']
-            df = df[~df['country'].isin(invalid_countries)]
+            country = df['country']
+            if not isinstance(country.dtype, pd.CategoricalDtype):
+                country = country.astype('category')
+            
+            # Match invalid names per category rather than per row; names are
+            # title-cased by now, so the comparison ignores case
+            categories = country.cat.categories
+            invalid = categories.astype(str).str.strip().str.lower().isin(_INVALID_COUNTRIES)
+            if invalid.any():
+                keep = ~np.isin(country.cat.codes.to_numpy(), np.flatnonzero(invalid))
+                country = country.cat.remove_categories(categories[invalid])
+                df = df.assign(country=country)[keep]
         
         # Fix negative values that shouldn't be negative
-        numeric_cols = ['cases', 'deaths', 'recovered', 'active']
-        for col in numeric_cols:
-            if col in df.columns:
-                # Set negative values to 0 (or previous valid value)
-                df[col] = df[col].clip(lower=0)
+        # Set negative values to 0
+        numeric_cols = [col for col in ('cases', 'deaths', 'recovered', 'active') if col in df.columns]
+        if numeric_cols:
+            # One clip over the sub-frame works block-wise and keeps each dtype
+            df = df.assign(**df[numeric_cols].clip(lower=0))
         
         return df
     
-    def _load_country_mappings(self) -> Dict[str, str]:
-        """Load country name mappings for standardization."""
-        # Common country name variations and their standard names
-        mappings = {
-            'US': 'United States',
-            'USA': 'United States',
-            'United States of America': 'United States',
-            'UK': 'United Kingdom',
-            'Britain': 'United Kingdom',
-            'Great Britain': 'United Kingdom',
-            'South Korea': 'Korea, South',
-            'North Korea': 'Korea, North',
-            'Russia': 'Russian Federation',
-            'Iran': 'Iran, Islamic Republic of',
-            'Syria': 'Syrian Arab Republic',
-            'Venezuela': 'Venezuela, Bolivarian Republic of',
-            'Bolivia': 'Bolivia, Plurinational State of',
-            'Tanzania': 'Tanzania, United Republic of',
-            'Moldova': 'Moldova, Republic of',
-            'Macedonia': 'North Macedonia',
-            'Czech Republic': 'Czechia',
-            'Myanmar': 'Myanmar',
-            'Burma': 'Myanmar',
-            'Congo (Kinshasa)': 'Congo, Democratic Republic of the',
-            'Congo (Brazzaville)': 'Congo',
-            'Ivory Coast': "Cote d'Ivoire",
-        }
-        
-        return mappings
-    
     def calculate_growth_rates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate growth rates for time series data."""
         if 'historical' not in df.get('data_type', ''):
             return df
         
-        df = df.copy()
+        df = df.copy(deep=False)
         
         if all(col in df.columns for col in ['date', 'country', 'metric', 'value']):
             df = df.sort_values(['country', 'metric', 'date'])
             
-            # Calculate various growth rates
-            df['growth_rate_1day'] = df.groupby(['country', 'metric'])['value'].pct_change()
-            df['growth_rate_7day'] = df.groupby(['country', 'metric'])['value'].pct_change(periods=7)
-            df['growth_rate_14day'] = df.groupby(['country', 'metric'])['value'].pct_change(periods=14)
+            group_ids = df.groupby(['country', 'metric'], sort=False, observed=True).ngroup().to_numpy()
+            # Gaps are padded within each group first, as pandas pct_change does
+            values = _group_ffill(df['value'].to_numpy(dtype=np.float64), group_ids)
+            
+            # Calculate various growth rates from group-aware shifts
+            for periods in (1, 7, 14):
+                previous = _group_shift(values, group_ids, periods)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    df[f'growth_rate_{periods}day'] = (values - previous) / previous
             
             # Calculate doubling time (days for value to double at current growth rate)
-            df['doubling_time_days'] = np.where(
-                df['growth_rate_1day'] > 0,
-                np.log(2) / np.log(1 + df['growth_rate_1day']),
-                np.inf
-            )
+            # log1p stays accurate for small rates; non-growing rows stay inf
+            growth = df['growth_rate_1day'].to_numpy(dtype=np.float64)
+            growing = growth > 0
+            doubling = np.full(growth.shape, np.inf)
+            np.divide(_LN2, np.log1p(growth, out=np.ones_like(growth), where=growing),
+                      out=doubling, where=growing)
+            df['doubling_time_days'] = doubling
         
         return df
     
@@ -428,7 +685,7 @@ class CovidDataTransformer:
         if population_data is None or 'population' not in df.columns:
             return df
         
-        df = df.copy()
+        df = df.copy(deep=False)
         
         # Calculate per capita metrics
         if 'cases' in df.columns and 'population' in df.columns:
@@ -461,28 +718,62 @@ class CovidDataTransformer:
             saved_files = {}
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
+            # Determine file format
+            file_format = self.storage_config.get('file_format', 'parquet')
+            
+            writes = []
             for data_type, df in data.items():
                 if df.empty:
                     self.logger.warning(f"Skipping empty dataset: {data_type}")
                     continue
+                writes.append((data_type, df))
+            
+            # pyarrow releases the GIL while encoding and compressing, so
+            # independent datasets are written concurrently
+            max_workers = max(1, min(len(writes), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._write_one, data_type, df, output_path, timestamp, file_format)
+                    for data_type, df in writes
+                ]
                 
-                # Determine file format
-                file_format = self.storage_config.get('file_format', 'parquet')
-                
-                if file_format == 'parquet':
-                    filename = f"covid_{data_type}_processed_{timestamp}.parquet"
-                    filepath = output_path / filename
-                    df.to_parquet(filepath, index=False)
-                else:
-                    filename = f"covid_{data_type}_processed_{timestamp}.csv"
-                    filepath = output_path / filename
-                    df.to_csv(filepath, index=False)
-                
-                saved_files[data_type] = str(filepath)
-                self.logger.info(f"Saved processed {data_type} data to {filepath}")
+                for future in as_completed(futures):
+                    data_type, filepath = future.result()
+                    saved_files[data_type] = filepath
+                    self.logger.info(f"Saved processed {data_type} data to {filepath}")
             
             return saved_files
             
         except Exception as e:
             self.logger.error(f"Error saving transformed data: {str(e)}")
             raise
+    
+    def _write_one(self, data_type: str, df: pd.DataFrame, output_path: Path,
+                   timestamp: str, file_format: str) -> Tuple[str, str]:
+        """
+        Write a single processed dataset to disk.
+        
+        Args:
+            data_type: Dataset name used in the filename
+            df: Transformed DataFrame
+            output_path: Output directory
+            timestamp: Run timestamp used in the filename
+            file_format: 'parquet' or 'csv'
+            
+        Returns:
+            Tuple of (data_type, file path)
+        """
+        if file_format == 'parquet':
+            filename = f"covid_{data_type}_processed_{timestamp}.parquet"
+            filepath = output_path / filename
+            categorical = {col: 'category' for col in _DICTIONARY_COLUMNS
+                           if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)}
+            if categorical:
+                df = df.astype(categorical)
+            df.to_parquet(filepath, index=False, **_PARQUET_OPTIONS)
+        else:
+            filename = f"covid_{data_type}_processed_{timestamp}.csv"
+            filepath = output_path / filename
+            df.to_csv(filepath, index=False)
+        
+        return data_type, str(filepath)
@@ -4,14 +4,60 @@ Data validation utilities for COVID-19 ETL Pipeline.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Iterator, Tuple, Optional
 from datetime import datetime, timedelta
 import re
+import warnings
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
 
 from ..utils.config import config
 from ..utils.logger import get_logger
 
 
+# Leading YYYY-MM-DD that marks a column as ISO-8601 shaped
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+
+def _parse_dates(dates: pd.Series) -> pd.Series:
+    """
+    Parse a date column, using ciso8601 when the values are ISO-8601 strings.
+    
+    Columns that are already datetime64 (as produced by the transformer) are
+    returned unchanged, so upstream steps should hand over parsed dates.
+    
+    Args:
+        dates: Raw date column
+        
+    Returns:
+        datetime64 Series with NaT where a value could not be parsed
+    """
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+    
+    if ciso8601 is not None and dates.dtype == object and dates.notna().all():
+        values = dates.to_numpy()
+        if len(values) and isinstance(values[0], str) and _ISO_DATE_RE.match(values[0]):
+            try:
+                parsed = np.fromiter((ciso8601.parse_datetime_as_naive(value) for value in values),
+                                     dtype='datetime64[ns]', count=len(values))
+                return pd.Series(parsed, index=dates.index, name=dates.name)
+            except (TypeError, ValueError):
+                # Not uniformly ISO-8601; let pandas sort it out
+                pass
+    
+    # Format is inferred, so non-ISO raw dates (e.g. JHU m/d/yy) still parse
+    return pd.to_datetime(dates, errors='coerce')
+
+
 class DataValidator:
     """Data validation and quality checks for COVID-19 data."""
     
@@ -23,6 +69,9 @@ class DataValidator:
         # Validation thresholds
         self.max_null_percentage = self.quality_config.get('max_null_percentage', 0.1)
         self.min_record_count = self.quality_config.get('min_record_count', 100)
+        
+        # Exact (deep) memory usage walks every object cell, so it is opt-in
+        self.deep_memory_usage = self.quality_config.get('deep_memory_usage', False)
     
     def validate_dataframe(self, df: pd.DataFrame, data_type: str) -> Dict[str, Any]:
         """
@@ -49,6 +98,9 @@ class DataValidator:
         }
         
         try:
+            # Null counts are computed once and shared by the checks below
+            null_counts = df.isna().sum()
+            
             # Basic structure validation
             self._validate_structure(df, validation_results)
             
@@ -56,14 +108,14 @@ class DataValidator:
             if data_type == 'global':
                 self._validate_global_data(df, validation_results)
             elif data_type == 'countries':
-                self._validate_countries_data(df, validation_results)
+                self._validate_countries_data(df, validation_results, null_counts)
             elif data_type == 'historical':
                 self._validate_historical_data(df, validation_results)
             elif data_type == 'vaccines':
                 self._validate_vaccine_data(df, validation_results)
             
             # Common data quality checks
-            self._validate_data_quality(df, validation_results)
+            self._validate_data_quality(df, validation_results, null_counts)
             
             # Calculate quality score
             validation_results['quality_score'] = self._calculate_quality_score(validation_results)
@@ -94,8 +146,11 @@ class DataValidator:
             )
         
         # Check for duplicate rows
-        duplicate_count = df.duplicated().sum()
-        if duplicate_count > 0:
+        # Only count duplicates when there are any (any() short-circuits)
+        duplicated = df.duplicated()
+        duplicate_count = 0
+        if duplicated.any():
+            duplicate_count = int(duplicated.sum())
             results['warnings'].append(f"Found {duplicate_count} duplicate rows")
         
         results['quality_metrics']['duplicate_percentage'] = duplicate_count / len(df)
@@ -112,9 +167,10 @@ class DataValidator:
         
         # Validate numeric columns
         numeric_columns = ['cases', 'deaths', 'recovered', 'active', 'todayCases', 'todayDeaths']
+        numeric_set = set(df.select_dtypes(include=[np.number, 'bool']).columns)
         for col in numeric_columns:
             if col in df.columns:
-                if not pd.api.types.is_numeric_dtype(df[col]):
+                if col not in numeric_set:
                     results['errors'].append(f"Column {col} should be numeric")
                     results['is_valid'] = False
                 
@@ -122,7 +178,8 @@ class DataValidator:
                 if col in ['cases', 'deaths', 'recovered'] and (df[col] < 0).any():
                     results['warnings'].append(f"Found negative values in {col}")
     
-    def _validate_countries_data(self, df: pd.DataFrame, results: Dict[str, Any]) -> None:
+    def _validate_countries_data(self, df: pd.DataFrame, results: Dict[str, Any],
+                                 null_counts: Optional[pd.Series] = None) -> None:
         """Validate countries COVID-19 data."""
         required_columns = ['country', 'cases', 'deaths']
         
@@ -134,26 +191,48 @@ class DataValidator:
         
         # Validate country names
         if 'country' in df.columns:
-            null_countries = df['country'].isnull().sum()
+            if null_counts is not None:
+                null_countries = null_counts['country']
+            else:
+                null_mask = df['country'].isnull()
+                null_countries = int(null_mask.sum()) if null_mask.any() else 0
             if null_countries > 0:
                 results['errors'].append(f"Found {null_countries} null country names")
                 results['is_valid'] = False
             
             # Check for duplicate countries
-            duplicate_countries = df['country'].duplicated().sum()
-            if duplicate_countries > 0:
-                results['warnings'].append(f"Found {duplicate_countries} duplicate countries")
+            duplicated_countries = df['country'].duplicated()
+            if duplicated_countries.any():
+                results['warnings'].append(f"Found {int(duplicated_countries.sum())} duplicate countries")
         
         # Validate ISO codes if present
-        if 'country_iso2' in df.columns:
-            invalid_iso2 = df[df['country_iso2'].notna()]['country_iso2'].str.len() != 2
-            if invalid_iso2.any():
-                results['warnings'].append("Found invalid ISO2 codes")
-        
-        if 'country_iso3' in df.columns:
-            invalid_iso3 = df[df['country_iso3'].notna()]['country_iso3'].str.len() != 3
-            if invalid_iso3.any():
-                results['warnings'].append("Found invalid ISO3 codes")
+        for col, length in (('country_iso2', 2), ('country_iso3', 3)):
+            if col in df.columns and self._has_invalid_code_length(df[col], length):
+                results['warnings'].append(f"Found invalid ISO{length} codes")
+    
+    def _has_invalid_code_length(self, codes: pd.Series, length: int) -> bool:
+        """
+        Check whether any non-null code differs from the expected length.
+        
+        Args:
+            codes: Code column (e.g. ISO2 or ISO3 country codes)
+            length: Expected code length
+            
+        Returns:
+            True if at least one non-null code has the wrong length
+        """
+        values = codes.to_numpy()
+        values = values[pd.notna(values)]
+        if not len(values):
+            return False
+        
+        # Non-string codes count as invalid
+        if pd.api.types.infer_dtype(values, skipna=False) != 'string':
+            return True
+        
+        # Fixed-width Unicode sized to the longest code, so nothing is
+        # truncated; str_len then runs as a C loop over the buffer
+        return bool((np.char.str_len(values.astype(str)) != length).any())
     
     def _validate_historical_data(self, df: pd.DataFrame, results: Dict[str, Any]) -> None:
         """Validate historical COVID-19 data."""
@@ -167,16 +246,16 @@ class DataValidator:
         
         # Validate date column
         if 'date' in df.columns:
-            try:
-                pd.to_datetime(df['date'])
-            except Exception:
+            # Parse once and reuse; values that fail to parse become NaT
+            dates = _parse_dates(df['date'])
+            if dates.isna().sum() > df['date'].isna().sum():
                 results['errors'].append("Invalid date format in date column")
                 results['is_valid'] = False
             
             # Check date range
-            if not df.empty:
-                min_date = pd.to_datetime(df['date']).min()
-                max_date = pd.to_datetime(df['date']).max()
+            if dates.notna().any():
+                min_date = dates.min()
+                max_date = dates.max()
                 
                 # COVID-19 started around December 2019
                 if min_date < pd.Timestamp('2019-12-01'):
@@ -188,9 +267,15 @@ class DataValidator:
         
         # Validate metrics
         if 'metric' in df.columns:
-            valid_metrics = ['cases', 'deaths', 'recovered']
-            invalid_metrics = df[~df['metric'].isin(valid_metrics)]['metric'].unique()
-            if len(invalid_metrics) > 0:
+            valid_metrics = np.array(['cases', 'deaths', 'recovered'], dtype=object)
+            
+            # With only three valid values, a direct compare beats hashing.
+            # Missing values become None, since Arrow-backed columns would
+            # otherwise yield pd.NA, which np.isin cannot compare
+            metrics = df['metric'].to_numpy(dtype=object, na_value=None)
+            unknown = ~np.isin(metrics, valid_metrics)
+            if unknown.any():
+                invalid_metrics = pd.unique(metrics[unknown])
                 results['warnings'].append(f"Unknown metrics found: {invalid_metrics}")
     
     def _validate_vaccine_data(self, df: pd.DataFrame, results: Dict[str, Any]) -> None:
@@ -200,46 +285,62 @@ class DataValidator:
             # This would need more specific validation based on actual vaccine data structure
             pass
     
-    def _validate_data_quality(self, df: pd.DataFrame, results: Dict[str, Any]) -> None:
+    def _validate_data_quality(self, df: pd.DataFrame, results: Dict[str, Any],
+                               null_counts: Optional[pd.Series] = None) -> None:
         """Perform general data quality checks."""
         # Check null percentages
-        null_percentages = df.isnull().sum() / len(df)
-        high_null_columns = null_percentages[null_percentages > self.max_null_percentage]
-        
-        if not high_null_columns.empty:
+        if null_counts is None:
+            null_counts = df.isnull().sum()
+        columns = null_counts.index.to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            null_percentages = null_counts.to_numpy() / len(df)
+        high_null_mask = null_percentages > self.max_null_percentage
+        
+        if high_null_mask.any():
+            high_null_columns = dict(zip(columns[high_null_mask].tolist(),
+                                         null_percentages[high_null_mask].tolist()))
             results['warnings'].append(
-                f"High null percentage in columns: {high_null_columns.to_dict()}"
+                f"High null percentage in columns: {high_null_columns}"
             )
         
-        results['quality_metrics']['null_percentages'] = null_percentages.to_dict()
+        results['quality_metrics']['null_percentages'] = dict(zip(columns.tolist(),
+                                                                  null_percentages.tolist()))
         
         # Check data types
         results['quality_metrics']['data_types'] = df.dtypes.astype(str).to_dict()
         
         # Memory usage
-        results['quality_metrics']['memory_usage_mb'] = df.memory_usage(deep=True).sum() / 1024 / 1024
+        memory_usage = df.memory_usage(deep=self.deep_memory_usage).sum()
+        results['quality_metrics']['memory_usage_mb'] = memory_usage / 1024 / 1024
         
-        # Check for outliers in numeric columns
+        # Nothing to measure outliers on in an empty frame
         numeric_columns = df.select_dtypes(include=[np.number]).columns
-        outlier_info = {}
+        if len(df) == 0 or len(numeric_columns) == 0:
+            results['quality_metrics']['outliers'] = {}
+            return
         
-        for col in numeric_columns:
-            if col in df.columns and not df[col].empty:
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-                outlier_percentage = len(outliers) / len(df)
-                
-                outlier_info[col] = {
-                    'count': len(outliers),
-                    'percentage': outlier_percentage,
-                    'lower_bound': lower_bound,
-                    'upper_bound': upper_bound
-                }
+        # Check for outliers in numeric columns with one batched IQR pass
+        values = df[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        # All-NaN columns yield NaN bounds (and no outliers) without warning
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            Q1, Q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+        
+        IQR = Q3 - Q1
+        lower_bounds = Q1 - 1.5 * IQR
+        upper_bounds = Q3 + 1.5 * IQR
+        outlier_counts = ((values < lower_bounds) | (values > upper_bounds)).sum(axis=0)
+        
+        outlier_info = {}
+        for col, count, lower_bound, upper_bound in zip(numeric_columns, outlier_counts,
+                                                        lower_bounds, upper_bounds):
+            outlier_info[col] = {
+                'count': int(count),
+                'percentage': count / len(df),
+                'lower_bound': lower_bound,
+                'upper_bound': upper_bound
+            }
         
         results['quality_metrics']['outliers'] = outlier_info
     
@@ -283,37 +384,44 @@ class DataValidator:
         
         try:
             if data_type in ['global', 'countries']:
+                # Read each column into a contiguous float64 array once and
+                # reuse deaths + recovered across the rules
+                columns = {col: df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                           for col in ['cases', 'deaths', 'recovered', 'active'] if col in df.columns}
+                cases = columns.get('cases')
+                deaths = columns.get('deaths')
+                recovered = columns.get('recovered')
+                active = columns.get('active')
+                
                 # Cases should be >= deaths + recovered
-                if all(col in df.columns for col in ['cases', 'deaths', 'recovered']):
-                    invalid_totals = df[df['cases'] < (df['deaths'] + df['recovered'])]
-                    if not invalid_totals.empty:
+                if cases is not None and deaths is not None and recovered is not None:
+                    deaths_recovered = deaths + recovered
+                    invalid_totals = int((cases < deaths_recovered).sum())
+                    if invalid_totals:
                         violations.append(
-                            f"Found {len(invalid_totals)} records where cases < deaths + recovered"
+                            f"Found {invalid_totals} records where cases < deaths + recovered"
                         )
-                
-                # Active cases should equal cases - deaths - recovered (approximately)
-                if all(col in df.columns for col in ['cases', 'deaths', 'recovered', 'active']):
-                    calculated_active = df['cases'] - df['deaths'] - df['recovered']
-                    difference = abs(df['active'] - calculated_active)
-                    
-                    # Allow some tolerance for data inconsistencies
-                    tolerance = df['cases'] * 0.01  # 1% tolerance
-                    significant_differences = difference > tolerance
                     
-                    if significant_differences.any():
-                        violations.append(
-                            f"Found {significant_differences.sum()} records with "
-                            f"inconsistent active case calculations"
-                        )
+                    # Active cases should equal cases - deaths - recovered (approximately)
+                    if active is not None:
+                        # Allow some tolerance for data inconsistencies (1% of cases)
+                        significant_differences = int(self._active_mismatch(
+                            cases, deaths_recovered, active).sum())
+                        
+                        if significant_differences:
+                            violations.append(
+                                f"Found {significant_differences} records with "
+                                f"inconsistent active case calculations"
+                            )
                 
-                # Death rate should be reasonable (typically < 10%)
-                if all(col in df.columns for col in ['cases', 'deaths']):
-                    death_rate = df['deaths'] / df['cases']
-                    high_death_rate = death_rate > 0.1  # More than 10%
+                # Death rate should be reasonable (typically < 10%); compared
+                # as deaths > 0.1 * cases to avoid the division
+                if cases is not None and deaths is not None:
+                    high_death_rate = int((deaths > 0.1 * cases).sum())
                     
-                    if high_death_rate.any():
+                    if high_death_rate:
                         violations.append(
-                            f"Found {high_death_rate.sum()} records with "
+                            f"Found {high_death_rate} records with "
                             f"unusually high death rates (>10%)"
                         )
             
@@ -323,6 +431,28 @@ class DataValidator:
             self.logger.error(f"Error validating business rules: {str(e)}")
             return [f"Business rule validation error: {str(e)}"]
     
+    def _active_mismatch(self, cases: np.ndarray, deaths_recovered: np.ndarray,
+                         active: np.ndarray) -> np.ndarray:
+        """
+        Flag rows whose active count is more than 1% of cases off.
+        
+        Args:
+            cases: Case counts
+            deaths_recovered: Deaths plus recovered counts
+            active: Active case counts
+            
+        Returns:
+            Boolean mask of inconsistent rows
+        """
+        if numexpr is not None:
+            # One fused, multi-threaded pass without temporaries
+            return numexpr.evaluate(
+                "abs(active - (cases - deaths_recovered)) > cases * 0.01",
+                local_dict={'active': active, 'cases': cases, 'deaths_recovered': deaths_recovered}
+            )
+        
+        return np.abs(active - (cases - deaths_recovered)) > cases * 0.01
+    
     def generate_validation_report(self, validation_results: List[Dict[str, Any]]) -> str:
         """
         Generate a comprehensive validation report.
@@ -333,46 +463,42 @@ class DataValidator:
         Returns:
             Formatted validation report
         """
-        report_lines = [
-            "COVID-19 Data Validation Report",
-            "=" * 40,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            ""
-        ]
+        return "\n".join(self._iter_report_lines(validation_results))
+    
+    def _iter_report_lines(self, validation_results: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield the lines of the validation report in order."""
+        yield "COVID-19 Data Validation Report"
+        yield "=" * 40
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield ""
         
         total_datasets = len(validation_results)
         valid_datasets = sum(1 for r in validation_results if r['is_valid'])
         
-        report_lines.extend([
-            f"Total Datasets: {total_datasets}",
-            f"Valid Datasets: {valid_datasets}",
-            f"Invalid Datasets: {total_datasets - valid_datasets}",
-            ""
-        ])
+        yield f"Total Datasets: {total_datasets}"
+        yield f"Valid Datasets: {valid_datasets}"
+        yield f"Invalid Datasets: {total_datasets - valid_datasets}"
+        yield ""
         
         for result in validation_results:
-            report_lines.extend([
-                f"Dataset: {result['data_type']}",
-                "-" * 20,
-                f"Records: {result['record_count']:,}",
-                f"Columns: {result['column_count']}",
-                f"Valid: {'Yes' if result['is_valid'] else 'No'}",
-                f"Quality Score: {result.get('quality_score', 0):.1f}/100",
-                ""
-            ])
+            yield f"Dataset: {result['data_type']}"
+            yield "-" * 20
+            yield f"Records: {result['record_count']:,}"
+            yield f"Columns: {result['column_count']}"
+            yield f"Valid: {'Yes' if result['is_valid'] else 'No'}"
+            yield f"Quality Score: {result.get('quality_score', 0):.1f}/100"
+            yield ""
             
             if result['errors']:
-                report_lines.append("Errors:")
+                yield "Errors:"
                 for error in result['errors']:
-                    report_lines.append(f"  - {error}")
-                report_lines.append("")
+                    yield f"  - {error}"
+                yield ""
             
             if result['warnings']:
-                report_lines.append("Warnings:")
+                yield "Warnings:"
                 for warning in result['warnings']:
-                    report_lines.append(f"  - {warning}")
-                report_lines.append("")
+                    yield f"  - {warning}"
+                yield ""
             
-            report_lines.append("")
-        
-        return "\n".join(report_lines)
+            yield ""
@@ -3,10 +3,48 @@ Configuration management for COVID-19 ETL Pipeline.
 """
 
 import os
+import threading
 import yaml
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Environment variables that override config values: (variable, (section, key), cast)
+_ENV_MAP = (
+    # API Configuration
+    ('COVID_API_BASE_URL', ('api', 'base_url'), str),
+    ('COVID_API_RATE_LIMIT', ('api', 'rate_limit'), int),
+    # Storage Configuration
+    ('STORAGE_PROVIDER', ('storage', 'provider'), str),
+    ('STORAGE_BUCKET', ('storage', 'bucket'), str),
+    # AWS Configuration
+    ('AWS_ACCESS_KEY_ID', ('aws', 'access_key_id'), str),
+    ('AWS_SECRET_ACCESS_KEY', ('aws', 'secret_access_key'), str),
+    ('AWS_REGION', ('aws', 'region'), str),
+    # GCP Configuration
+    ('GOOGLE_APPLICATION_CREDENTIALS', ('gcp', 'credentials_path'), str),
+    ('GCP_PROJECT_ID', ('gcp', 'project_id'), str),
+    # Database Configuration
+    ('DB_HOST', ('database', 'host'), str),
+    ('DB_PORT', ('database', 'port'), int),
+    ('DB_NAME', ('database', 'name'), str),
+    ('DB_USER', ('database', 'user'), str),
+    ('DB_PASSWORD', ('database', 'password'), str),
+    ('REDSHIFT_IAM_ROLE', ('database', 'iam_role'), str),
+)
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key into its path components (memoized)."""
+    return tuple(key.split('.'))
+
 
 class Config:
     """Configuration manager for the ETL pipeline."""
@@ -27,12 +65,15 @@ class Config:
         
         self.config_path = config_path
         self._config = self._load_config()
+        
+        # Resolved values by key; cleared whenever the configuration changes
+        self._cache: Dict[str, Any] = {}
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
             with open(self.config_path, 'r') as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=_YamlLoader)
             
             # Override with environment variables if they exist
             config = self._override_with_env_vars(config)
@@ -44,43 +85,10 @@ class Config:
     
     def _override_with_env_vars(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Override configuration with environment variables."""
-        # API Configuration
-        if os.getenv('COVID_API_BASE_URL'):
-            config['api']['base_url'] = os.getenv('COVID_API_BASE_URL')
-        if os.getenv('COVID_API_RATE_LIMIT'):
-            config['api']['rate_limit'] = int(os.getenv('COVID_API_RATE_LIMIT'))
-        
-        # Storage Configuration
-        if os.getenv('STORAGE_PROVIDER'):
-            config['storage']['provider'] = os.getenv('STORAGE_PROVIDER')
-        if os.getenv('STORAGE_BUCKET'):
-            config['storage']['bucket'] = os.getenv('STORAGE_BUCKET')
-        
-        # AWS Configuration
-        if os.getenv('AWS_ACCESS_KEY_ID'):
-            config['aws']['access_key_id'] = os.getenv('AWS_ACCESS_KEY_ID')
-        if os.getenv('AWS_SECRET_ACCESS_KEY'):
-            config['aws']['secret_access_key'] = os.getenv('AWS_SECRET_ACCESS_KEY')
-        if os.getenv('AWS_REGION'):
-            config['aws']['region'] = os.getenv('AWS_REGION')
-        
-        # GCP Configuration
-        if os.getenv('GOOGLE_APPLICATION_CREDENTIALS'):
-            config['gcp']['credentials_path'] = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
-        if os.getenv('GCP_PROJECT_ID'):
-            config['gcp']['project_id'] = os.getenv('GCP_PROJECT_ID')
-        
-        # Database Configuration
-        if os.getenv('DB_HOST'):
-            config['database']['host'] = os.getenv('DB_HOST')
-        if os.getenv('DB_PORT'):
-            config['database']['port'] = int(os.getenv('DB_PORT'))
-        if os.getenv('DB_NAME'):
-            config['database']['name'] = os.getenv('DB_NAME')
-        if os.getenv('DB_USER'):
-            config['database']['user'] = os.getenv('DB_USER')
-        if os.getenv('DB_PASSWORD'):
-            config['database']['password'] = os.getenv('DB_PASSWORD')
+        for env_var, (section, key), cast in _ENV_MAP:
+            value = os.environ.get(env_var)
+            if value:
+                config.setdefault(section, {})[key] = cast(value)
         
         return config
     
@@ -99,7 +107,8 @@ class Config:
                 'bucket': 'covid-etl-data',
                 'raw_data_prefix': 'raw/',
                 'processed_data_prefix': 'processed/',
-                'file_format': 'parquet'
+                'file_format': 'parquet',
+                'cache_dir': ''
             },
             'aws': {
                 'region': 'us-east-1',
@@ -117,7 +126,9 @@ class Config:
                 'name': 'covid_data',
                 'user': '',
                 'password': '',
-                'schema': 'public'
+                'schema': 'public',
+                'iam_role': '',
+                'staging_prefix': 'staging/redshift/'
             },
             'airflow': {
                 'dag_id': 'covid_etl_pipeline',
@@ -135,6 +146,7 @@ class Config:
                 'enable_validation': True,
                 'max_null_percentage': 0.1,
                 'min_record_count': 100,
+                'deep_memory_usage': False,
                 'enable_alerts': True
             }
         }
@@ -150,15 +162,21 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        
         value = self._config
         
         try:
-            for k in keys:
+            for k in _split_key(key):
                 value = value[k]
-            return value
         except (KeyError, TypeError):
             return default
+        
+        self._cache[key] = value
+        return value
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -168,7 +186,7 @@ class Config:
             key: Configuration key (supports dot notation)
             value: Value to set
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self._config
         
         for k in keys[:-1]:
@@ -177,6 +195,7 @@ class Config:
             config = config[k]
         
         config[keys[-1]] = value
+        self._cache.clear()
     
     def get_api_config(self) -> Dict[str, Any]:
         """Get API configuration."""
@@ -215,5 +234,25 @@ class Config:
         return self._config.copy()
 
 
-# Global configuration instance
-config = Config()
+class _LazyConfig:
+    """Proxy for the global Config that loads the YAML file on first use."""
+    
+    def __init__(self):
+        """Initialize proxy without reading any configuration."""
+        self._instance: Optional[Config] = None
+        self._lock = threading.Lock()
+    
+    def _get_instance(self) -> Config:
+        """Build the Config on first access."""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = Config()
+        return self._instance
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_instance(), name)
+
+
+# Global configuration instance (loaded lazily on first attribute access)
+config = _LazyConfig()
@@ -2,13 +2,84 @@
 Logging utilities for COVID-19 ETL Pipeline.
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 from .config import config
 
 
+# Rotation defaults for the log file, overridable via logging.max_bytes/backup_count
+_MAX_LOG_BYTES = 10 * 1024 * 1024
+_LOG_BACKUP_COUNT = 5
+
+# One queue handler per log file; each feeds a background listener that owns
+# the console and file handlers, so logging calls only enqueue records
+_queue_handlers: Dict[Optional[str], QueueHandler] = {}
+_listeners = []
+_handlers_lock = threading.Lock()
+
+
+def _get_queue_handler(log_file: Optional[str], level: int,
+                       formatter: logging.Formatter, log_config: Dict[str, Any]) -> QueueHandler:
+    """
+    Get the shared queue handler for a log file, starting its listener once.
+    
+    Args:
+        log_file: Log file path, or None for console only
+        level: Logging level for the output handlers
+        formatter: Formatter for the output handlers
+        log_config: Logging configuration
+        
+    Returns:
+        QueueHandler that forwards records to the listener
+    """
+    with _handlers_lock:
+        if log_file in _queue_handlers:
+            return _queue_handlers[log_file]
+        
+        # Console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(level)
+        console_handler.setFormatter(formatter)
+        handlers = [console_handler]
+        
+        # File handler; delay=True opens the file on the first record
+        if log_file:
+            # Create log directory if it doesn't exist
+            log_path = Path(log_file)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            file_handler = RotatingFileHandler(
+                log_file,
+                maxBytes=log_config.get('max_bytes', _MAX_LOG_BYTES),
+                backupCount=log_config.get('backup_count', _LOG_BACKUP_COUNT),
+                delay=True
+            )
+            file_handler.setLevel(level)
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        
+        queue_handler = QueueHandler(queue.SimpleQueue())
+        listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        listener.start()
+        
+        _listeners.append(listener)
+        _queue_handlers[log_file] = queue_handler
+        return queue_handler
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Flush queued records and stop the background listeners at exit."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
 class ETLLogger:
     """Custom logger for ETL pipeline."""
     
@@ -40,25 +111,11 @@ class ETLLogger:
         # Create formatter
         formatter = logging.Formatter(format_str)
         
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-        
-        # File handler
         if log_file is None:
             log_file = log_config.get('file_path', 'logs/covid_etl.log')
         
-        if log_file:
-            # Create log directory if it doesn't exist
-            log_path = Path(log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(level)
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+        # Records are handed to a background listener via a queue
+        self.logger.addHandler(_get_queue_handler(log_file or None, level, formatter, log_config))
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message."""
@@ -1,113 +1,198 @@
 #!/usr/bin/env python3
 """
 Quick test script to verify imports and basic functionality.
+
+Run with the pipeline sources on the path, e.g. ``PYTHONPATH=src python
+test_imports.py``; otherwise src/ is appended to sys.path as a fallback.
 """
 
+import importlib
+import importlib.util
+import logging
 import sys
 import os
+from datetime import date
 from pathlib import Path
 
-# Add src directory to Python path
-project_root = Path(__file__).parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+logger = logging.getLogger("covid_etl_test")
+
+def _bootstrap_path():
+    """Make the src directory importable when it is not already on the path."""
+    if importlib.util.find_spec("extract") is not None:
+        return
+
+    # Append rather than prepend so stdlib/site lookups are not slowed by src/
+    src_path = os.fspath(Path(__file__).parent / "src")
+    if src_path not in sys.path:
+        sys.path.append(src_path)
+
+# Pipeline modules checked by test_imports, with their display names
+_MODULES = (
+    ("extract.covid_api_extractor", "CovidDataExtractor"),
+    ("transform.data_transformer", "CovidDataTransformer"),
+    ("utils.config", "Config"),
+)
+
+# Seconds a single API request may take before the test reports a timeout
+_REQUEST_TIMEOUT = 30
+
+# Status-message templates, filled in with %-formatting
+_MSG_IMPORT_FAILED = "❌ Failed to import %s: %s"
+_MSG_IMPORT_OK = "✅ %s imported successfully"
+_MSG_API_FAILED = "❌ API connection failed: %s"
+_MSG_EXTRACTED = "✅ Successfully extracted global data: %d records"
+_MSG_COLUMNS = "   Columns: %s..."
+_MSG_TIMEOUT = "⏱️  API request exceeded %ds timeout"
+_MSG_EXTRACTION_FAILED = "❌ Data extraction failed: %s"
+
+def _make_extractor():
+    """Build an extractor whose API requests are bounded by _REQUEST_TIMEOUT."""
+    _bootstrap_path()
+    from extract.covid_api_extractor import CovidDataExtractor
+
+    extractor = CovidDataExtractor()
+    extractor.api_client.timeout = min(extractor.api_client.timeout, _REQUEST_TIMEOUT)
+    return extractor
+
+def _cache_dir():
+    """Return the user-private directory that holds the extraction cache."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "covid-etl"
+
+def _cached_extract(extractor):
+    """Extract global data, reusing today's parquet copy when present."""
+    # The date in the file name makes the cache expire daily
+    path = _cache_dir() / f"covid_global_{date.today().isoformat()}.parquet"
+    if path.exists():
+        import pandas as pd
+        try:
+            return pd.read_parquet(path)
+        except (OSError, ImportError, ValueError):
+            pass  # Unreadable cache; fall back to the API
+    
+    global_data = extractor.extract_global_data()
+    if not global_data.empty:
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            for stale in path.parent.glob("covid_global_*.parquet"):
+                stale.unlink()
+            global_data.to_parquet(path, index=False)
+        except (OSError, ImportError, ValueError):
+            pass  # Caching is best-effort
+    return global_data
+
+def _emit(lines):
+    """Log a batch of status lines as a single record."""
+    logger.info("%s", "\n".join(lines))
 
 def test_imports():
     """Test if all modules can be imported."""
-    print("🧪 Testing module imports...")
-    
-    try:
-        from extract.covid_api_extractor import CovidDataExtractor
-        print("✅ CovidDataExtractor imported successfully")
-    except Exception as e:
-        print(f"❌ Failed to import CovidDataExtractor: {e}")
-        return False
-    
-    try:
-        from transform.data_transformer import CovidDataTransformer
-        print("✅ CovidDataTransformer imported successfully")
-    except Exception as e:
-        print(f"❌ Failed to import CovidDataTransformer: {e}")
-        return False
-    
+    _bootstrap_path()
+    msgs = ["🧪 Testing module imports..."]
+
     try:
-        from utils.config import config
-        print("✅ Config imported successfully")
-    except Exception as e:
-        print(f"❌ Failed to import config: {e}")
-        return False
-    
-    return True
+        for module_name, display_name in _MODULES:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                msgs.append(_MSG_IMPORT_FAILED % (display_name, e))
+                return False
+            msgs.append(_MSG_IMPORT_OK % display_name)
+
+        return True
+    finally:
+        _emit(msgs)
 
-def test_api_connection():
+def test_api_connection(extractor=None):
     """Test API connection."""
-    print("\n🌐 Testing API connection...")
-    
+    msgs = ["\n🌐 Testing API connection..."]
+
     try:
-        from extract.covid_api_extractor import CovidDataExtractor
-        extractor = CovidDataExtractor()
-        
+        extractor = extractor or _make_extractor()
+
         # Test API health check
         if extractor.api_client.health_check():
-            print("✅ API connection successful")
+            msgs.append("✅ API connection successful")
             return True
         else:
-            print("❌ API health check failed")
+            msgs.append("❌ API health check failed")
             return False
-            
+
     except Exception as e:
-        print(f"❌ API connection failed: {e}")
+        msgs.append(_MSG_API_FAILED % e)
         return False
+    finally:
+        _emit(msgs)
 
-def test_basic_extraction():
+def test_basic_extraction(extractor=None):
     """Test basic data extraction."""
-    print("\n📊 Testing basic data extraction...")
-    
+    msgs = ["\n📊 Testing basic data extraction..."]
+
     try:
-        from extract.covid_api_extractor import CovidDataExtractor
-        extractor = CovidDataExtractor()
-        
+        import requests
+
+        extractor = extractor or _make_extractor()
+
         # Extract global data
-        global_data = extractor.extract_global_data()
-        
+        global_data = _cached_extract(extractor)
+
         if not global_data.empty:
-            print(f"✅ Successfully extracted global data: {len(global_data)} records")
-            print(f"   Columns: {list(global_data.columns)[:5]}...")  # Show first 5 columns
+            msgs.append(_MSG_EXTRACTED % global_data.shape[0])
+            msgs.append(_MSG_COLUMNS % (global_data.columns[:5].tolist(),))  # Show first 5 columns
             return True
         else:
-            print("❌ No global data extracted")
+            msgs.append("❌ No global data extracted")
             return False
-            
+
+    except requests.exceptions.Timeout:
+        msgs.append(_MSG_TIMEOUT % _REQUEST_TIMEOUT)
+        return False
     except Exception as e:
-        print(f"❌ Data extraction failed: {e}")
+        msgs.append(_MSG_EXTRACTION_FAILED % e)
         return False
+    finally:
+        _emit(msgs)
 
 def main():
     """Run all tests."""
-    print("🦠 COVID-19 ETL Pipeline - Quick Test")
-    print("=" * 40)
-    
+    # Import-only probe for container health checks: every pipeline module is
+    # imported, so a broken install or missing dependency exits 1; all
+    # network stages are skipped
+    if os.environ.get("COVID_ETL_QUICK_TEST"):
+        sys.exit(0 if test_imports() else 1)
+
+    _emit(["🦠 COVID-19 ETL Pipeline - Quick Test", "=" * 40])
+
     # Test 1: Imports
     if not test_imports():
-        print("\n❌ Import tests failed. Please check your Python environment.")
+        _emit(["\n❌ Import tests failed. Please check your Python environment."])
         return
-    
-    # Test 2: API Connection
-    if not test_api_connection():
-        print("\n⚠️  API connection failed. Check your internet connection.")
-        print("   You can still proceed with local testing.")
-    
+
+    # One extractor, and so one HTTP session, is shared by the network tests
+    extractor = _make_extractor()
+
+    # Test 2: API Connection (checked once; the result gates extraction)
+    health_ok = test_api_connection(extractor)
+
+    msgs = []
+    if not health_ok:
+        msgs.append("\n⚠️  API connection failed. Check your internet connection.")
+        msgs.append("   You can still proceed with local testing.")
+
     # Test 3: Basic Extraction
-    if test_api_connection():  # Only test extraction if API is working
-        if test_basic_extraction():
-            print("\n🎉 All tests passed! Your pipeline is ready to use.")
+    if health_ok:  # Only test extraction if API is working
+        if test_basic_extraction(extractor):
+            msgs.append("\n🎉 All tests passed! Your pipeline is ready to use.")
         else:
-            print("\n⚠️  Basic extraction failed. Check the logs for details.")
-    
-    print("\n📋 Next Steps:")
-    print("1. Run full pipeline: python scripts/run_pipeline.py")
-    print("2. Check documentation: docs/setup_guide.md")
-    print("3. Configure cloud credentials if needed")
+            msgs.append("\n⚠️  Basic extraction failed. Check the logs for details.")
+
+    msgs.append("\n📋 Next Steps:")
+    msgs.append("1. Run full pipeline: python scripts/run_pipeline.py")
+    msgs.append("2. Check documentation: docs/setup_guide.md")
+    msgs.append("3. Configure cloud credentials if needed")
+    msgs.append("4. For an import-only health check (exit 1 on import errors), set COVID_ETL_QUICK_TEST=1")
+    _emit(msgs)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()
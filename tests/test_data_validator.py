@@ -0,0 +1,37 @@
+"""
+Behaviour tests for the data validator helpers.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.transform.data_validator import DataValidator
+
+
+@pytest.fixture
+def validator():
+    return DataValidator()
+
+
+@pytest.mark.parametrize('codes, length, expected', [
+    (['US', 'GB', 'FR'], 2, False),
+    (['USA', 'GBR', 'FRA'], 3, False),
+    (['US', 'GBR', 'FR'], 2, True),
+    (['US', '', 'FR'], 2, True),
+    (['US', None, np.nan, 'FR'], 2, False),
+    ([None, np.nan], 2, False),
+    ([], 3, False),
+    (['US', 12, 'FR'], 2, True),
+])
+def test_has_invalid_code_length(validator, codes, length, expected):
+    codes = pd.Series(codes, dtype=object)
+    
+    assert validator._has_invalid_code_length(codes, length) is expected
+
+
+def test_has_invalid_code_length_accepts_arrow_strings(validator):
+    codes = pd.Series(['USA', None, 'GBR'], dtype='string[pyarrow]')
+    
+    assert validator._has_invalid_code_length(codes, 3) is False
+    assert validator._has_invalid_code_length(codes, 2) is True
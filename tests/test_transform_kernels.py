@@ -0,0 +1,93 @@
+"""
+Behaviour tests for the array kernels in the data transformer.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.transform.data_transformer import (
+    _group_ffill,
+    _group_shift,
+    _iso_week,
+    _segmented_rolling_means,
+)
+
+
+@pytest.fixture
+def grouped():
+    """Values sorted by group, with NaNs at group starts and in the middle."""
+    group_ids = np.array([0, 0, 0, 0, 0, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2])
+    values = np.array([
+        1.0, np.nan, 4.0, 9.0, np.nan,
+        np.nan, 3.0,
+        2.0, 5.0, np.nan, np.nan, 11.0, 7.0, 20.0, 21.0, np.nan,
+    ])
+    return values, group_ids
+
+
+def test_iso_week_matches_isocalendar():
+    dates = pd.date_range('2019-12-20', '2027-01-10', freq='D')
+    days = dates.values.astype('datetime64[D]')
+    
+    weeks = _iso_week(days)
+    
+    expected = dates.isocalendar().week.to_numpy(dtype=np.uint32)
+    np.testing.assert_array_equal(weeks.to_numpy(dtype=np.uint32), expected)
+
+
+def test_iso_week_keeps_nat_missing():
+    days = np.array(['2021-01-03', 'NaT', '2021-01-04'], dtype='datetime64[D]')
+    
+    weeks = _iso_week(days)
+    
+    assert weeks.dtype == pd.UInt32Dtype()
+    assert weeks.isna().tolist() == [False, True, False]
+    assert weeks[0] == 53 and weeks[2] == 1
+
+
+@pytest.mark.parametrize('periods', [1, 2, 7, 20])
+def test_group_shift_matches_groupby_shift(grouped, periods):
+    values, group_ids = grouped
+    
+    shifted = _group_shift(values, group_ids, periods)
+    
+    expected = pd.Series(values).groupby(group_ids).shift(periods).to_numpy()
+    np.testing.assert_array_equal(shifted, expected)
+
+
+def test_group_shift_blanks_rows_without_group():
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+    group_ids = np.array([0, 0, -1, -1])
+    
+    shifted = _group_shift(values, group_ids, 1)
+    
+    np.testing.assert_array_equal(shifted, [np.nan, 1.0, np.nan, np.nan])
+
+
+def test_group_ffill_matches_groupby_ffill(grouped):
+    values, group_ids = grouped
+    
+    filled = _group_ffill(values, group_ids)
+    
+    expected = pd.Series(values).groupby(group_ids).ffill().to_numpy()
+    np.testing.assert_array_equal(filled, expected)
+
+
+@pytest.mark.parametrize('window', [1, 3, 7])
+def test_segmented_rolling_means_match_pandas_rolling(grouped, window):
+    values, group_ids = grouped
+    starts = np.flatnonzero(np.r_[True, group_ids[1:] != group_ids[:-1], True])
+    starts[-1] = len(values)
+    
+    change, value_avg, change_avg = _segmented_rolling_means(values, starts, window)
+    
+    by_group = pd.Series(values).groupby(group_ids)
+    expected_change = by_group.diff()
+    expected_value_avg = by_group.rolling(window, min_periods=1).mean().droplevel(0).sort_index()
+    expected_change_avg = (
+        expected_change.groupby(group_ids).rolling(window, min_periods=1).mean().droplevel(0).sort_index()
+    )
+    np.testing.assert_allclose(change, expected_change.to_numpy())
+    np.testing.assert_allclose(value_avg, expected_value_avg.to_numpy())
+    np.testing.assert_allclose(change_avg, expected_change_avg.to_numpy())
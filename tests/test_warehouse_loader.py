@@ -0,0 +1,45 @@
+"""
+Behaviour tests for the COPY stream used by the Redshift loader.
+"""
+
+import pytest
+
+from src.load.warehouse_loader import _CopyStream
+
+
+def test_read_all_joins_text_chunks():
+    stream = _CopyStream(iter(['a\tb\n', 'c\td\n']))
+    
+    assert stream.read() == 'a\tb\nc\td\n'
+    assert stream.read() == ''
+
+
+def test_read_all_joins_binary_chunks():
+    stream = _CopyStream(iter([b'PGCOPY', b'\x00\x01', b'\xff\xff']))
+    
+    assert stream.read(None) == b'PGCOPY\x00\x01\xff\xff'
+    assert stream.read() == b''
+
+
+@pytest.mark.parametrize('size', [1, 3, 4, 100])
+def test_sized_reads_span_chunk_boundaries(size):
+    chunks = ['abc', '', 'defg', 'h']
+    stream = _CopyStream(iter(chunks))
+    
+    pieces = []
+    while True:
+        piece = stream.read(size)
+        if not piece:
+            break
+        assert len(piece) <= size
+        pieces.append(piece)
+    
+    assert ''.join(pieces) == 'abcdefgh'
+
+
+def test_empty_stream_reads_empty():
+    stream = _CopyStream(iter([]))
+    
+    assert stream.readable()
+    assert stream.read() == b''
+    assert stream.read(10) == b''